@@ -0,0 +1,53 @@
+"""
+Module holds the command line helpers shared by the scripts in the
+examples folder
+
+Functions:
+    parse_gamepk(argv, with_delay): Gets the gamePk, and optionally the
+        delay, from command line arguments and prompts the user for
+        any that are missing
+"""
+
+import argparse
+from typing import List, Optional, Tuple
+
+def parse_gamepk(argv: Optional[List[str]] = None, with_delay: bool = False
+                 ) -> Tuple[int, Optional[float]]:
+    """
+    Gets the gamePk from the -g/--gamepk/--gamePk command line argument
+    and the delay from -d/--delay if with_delay is True. Prompts the
+    user for either one if it was not provided
+
+    Args:
+        argv (List[str], optional): Arguments to parse. Defaults to
+            sys.argv[1:]
+        with_delay (bool, optional): Also get the delay in seconds.
+            Defaults to False
+
+    Returns:
+        Tuple[int, Optional[float]]: gamePk and delay in seconds. The
+            delay is None if with_delay is False
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-g', '--gamepk', '--gamePk', dest='gamepk',
+                        help='gamePk', type=int)
+    if with_delay is True:
+        parser.add_argument('-d', '--delay', help='delay in seconds',
+                            type=float)
+
+    args = parser.parse_args(argv)
+
+    if args.gamepk is not None:
+        gamepk = args.gamepk
+    else:
+        gamepk = int(input('gamePk: '))
+
+    if with_delay is False:
+        return (gamepk, None)
+
+    if args.delay is not None:
+        delay = args.delay
+    else:
+        delay = float(input('delay: '))
+
+    return (gamepk, delay)
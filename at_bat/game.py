@@ -29,7 +29,7 @@ import pytz
 import statsapi # pylint: disable=E0401
 from tqdm import tqdm
 from dateutil import tz
-from at_bat.statsapi_plus import get_daily_gamepks
+from at_bat.statsapi_plus import get_daily_gamepks, get_game_dict
 
 MARGIN_OF_ERROR = 0.25/12 # Margin of Error of hawkeye system (inches)
 
@@ -122,7 +122,8 @@ class Game:
         """
         Returns the game data for a given gamePk. If time is provided, the game
         data at that time is returned. If time is not provided, the game data
-        at the current time is returned.
+        at the current time is returned through get_game_dict, which reuses
+        the previously parsed data when the game has not changed.
 
         Args:
             gamepk (int): gamepk for the desired game. Defaults to None.
@@ -133,6 +134,8 @@ class Game:
         Raises:
             ValueError: No gamepk  provided
             MaxRetriesError: Max retries reached
+            requests.HTTPError: If the request for the current game
+                data fails
 
         Returns:
             dict: The game data for the given gamePk
@@ -142,10 +145,10 @@ class Game:
         if gamepk is None:
             raise ValueError('gamePk not provided')
 
-        if time is not None:
-            delay_time = _get_utc_time_from_zulu(time)
-        else:
-            delay_time = _get_utc_time(delay_seconds=delay_seconds)
+        if time is None:
+            return get_game_dict(gamepk=gamepk, delay_seconds=delay_seconds)
+
+        delay_time = _get_utc_time_from_zulu(time)
 
         for i in range(max_retries):
             try:
@@ -39,6 +39,17 @@ class Runners:
             is not
         inning (int): The current inning number
     """
+    # int(Runners) -> readable sentence used by __str__
+    _RUNNERS_STR = {
+        0: 'bases empty',
+        1: 'runner on first',
+        2: 'runner on second',
+        3: 'runners on first and second',
+        4: 'runner on third',
+        5: 'runners on first and third',
+        6: 'runners on second and third',
+        7: 'bases loaded',
+    }
 
     def __init__(self):
         """
@@ -240,7 +251,7 @@ class Runners:
 
         return i
 
-    def __str__(self) -> str: # pylint: disable=R0911
+    def __str__(self) -> str:
         """
         Converts the current the current state of the bases into a
         readable sentence someone would say
@@ -249,24 +260,22 @@ class Runners:
             str: Readable sentence that represents the bases. 'bases
             empty', 'runner on first', 'bases loaded'
         """
-        if self.runners == [False, False, False]:
-            return 'bases empty'
-        if self.runners == [True, False, False]:
-            return 'runner on first'
-        if self.runners == [False, True, False]:
-            return 'runner on second'
-        if self.runners == [True, True, False]:
-            return 'runners on first and second'
-        if self.runners == [False, False, True]:
-            return 'runner on third'
-        if self.runners == [True, False, True]:
-            return 'runners on first and third'
-        if self.runners == [False, True, True]:
-            return 'runners on second and third'
-        if self.runners == [True, True, True]:
-            return 'bases loaded'
-
-        return 'unknown'
+        return self.runners_str(int(self))
+
+    @classmethod
+    def runners_str(cls, runners: int) -> str:
+        """
+        Same as str(Runners) but for the integer representation of the
+        bases so a Runners instance does not need to be built
+
+        Args:
+            runners (int): Integer representation of the bases from
+                int(Runners), 0 to 7
+
+        Returns:
+            str: Readable sentence that represents the bases
+        """
+        return cls._RUNNERS_STR[runners]
 
     def __repr__(self) -> str:
         """
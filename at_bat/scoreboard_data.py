@@ -8,18 +8,19 @@ Raises:
     ValueError: If isTopInning is not a boolean
 """
 
-import copy
 from datetime import datetime, timedelta, timezone
 import json
+import operator
 from typing import List
 
-from at_bat.statsapi_plus import get_re640_dataframe, get_wp780800_dataframe, find_division_from_id
+from at_bat.statsapi_plus import (get_re640_flat, re_lookup,
+                                  get_wp780800_dataframe, find_division_from_id)
 from at_bat.game import Game
 from at_bat.runners import Runners
-from at_bat.umpire import Umpire
+from at_bat.umpire import get_umpire_summary
 from at_bat.standings import Standings
 
-re640 = get_re640_dataframe()
+re640 = get_re640_flat()
 wp780800 = get_wp780800_dataframe()
 division_from_id = find_division_from_id()
 
@@ -309,7 +310,7 @@ class Team:
     """
     Contains the team data for the game as a sub-class to Score
     """
-    def __init__(self, game: Game, team: str):
+    def __init__(self, game: Game, team: str, standings: dict = None):
 
         gamedata = game.gameData.teams
         gamedata = getattr(gamedata, team)
@@ -330,18 +331,23 @@ class Team:
         self.division_rank: int = None
         self.games_back: str = None
 
-        self._get_standing_info()
+        self._get_standing_info(standings)
 
-    def _get_standing_info(self):
+    def _get_standing_info(self, standings_cache: dict = None):
         division = division_from_id[self.id]
 
-        league = division[0]
+        league = 'AL' if division[0] == 'A' else 'NL'
         division = division[1]
 
-        if league == 'A':
-            standings = Standings.get_standings(league='AL')
-        else:
-            standings = Standings.get_standings(league='NL')
+        # Share the standings request with the other team in the game
+        # when they are in the same league
+        if standings_cache is None:
+            standings_cache = {}
+
+        if league not in standings_cache:
+            standings_cache[league] = Standings.get_standings(league=league)
+
+        standings = standings_cache[league]
 
         if division == 'E':
             standings = standings.east
@@ -512,24 +518,13 @@ class RunExpectancy:
         runners.end_at_bat(at_bat)
         runners = int(runners)
 
-        is_first_base = bool(runners & 1)
-        is_second_base = bool(runners & 2)
-        is_third_base = bool(runners & 4)
-
-        state = ((re640['balls'] == balls) &
-               (re640['strikes'] == strikes) &
-                (re640['outs'] == outs) &
-                (re640['is_first_base'] == is_first_base) &
-                (re640['is_second_base'] == is_second_base) &
-                (re640['is_third_base'] == is_third_base))
+        count, average_runs, to_score, *_ = re_lookup(re640, balls, strikes,
+                                                      outs, runners)
 
-        self.average_runs = re640[state]['average_runs'].iloc[0]
-
-        no_score = re640[state]['0 runs'].iloc[0]
-        count = re640[state]['count'].iloc[0]
+        self.average_runs = float(average_runs)
 
         if count > 0:
-            self.to_score = 1 - (no_score / count)
+            self.to_score = float(to_score)
         else:
             self.to_score = -1 # No data
 
@@ -660,11 +655,19 @@ class UmpireDetails:
     Contains the umpire data for the game as a sub-class to ScoreboardData
     """
     def __init__(self, game: Game) -> None:
-        umpire = Umpire(game=game, method='monte')
-        umpire.calculate_game()
-        self.num_missed: int = umpire.num_missed_calls
-        self.home_favor: float = umpire.home_favor
-        self.home_wpa: float = umpire.home_wpa
+        if game.gameData.status.game_state == 'P':
+            # Pre-game, no pitches to check yet
+            self.num_missed: int = 0
+            self.home_favor: float = 0
+            self.home_wpa: float = 0
+            return None
+
+        num_missed, home_favor, home_wpa = get_umpire_summary(game, method='monte')
+        self.num_missed: int = num_missed
+        self.home_favor: float = home_favor
+        self.home_wpa: float = home_wpa
+        return None
+
     def to_dict(self) -> dict:
         """
         Return a dictionary representation of the UmpireDetails object
@@ -726,6 +729,14 @@ class ScoreboardData:
     easaily access the data needed to display the scoreboard and return
     changes in the data.
     """
+    __slots__ = ('gamepk', 'delay_seconds', 'game', 'abstractGameState',
+                 'abstractGameCode', 'detailedState', 'codedGameState',
+                 'statusCode', 'game_state', 'start_time', 'inning',
+                 'inning_state', 'probables', 'decisions', 'matchup', 'count',
+                 'away', 'home', 'pitch_details', 'hit_details',
+                 'run_expectancy', 'win_probability', 'umpire',
+                 'batting_order', 'flags', 'runners')
+
     def __init__(self, gamepk: int = None, delay_seconds: int = 0):
         self.gamepk: int = gamepk
         self.delay_seconds: int = delay_seconds
@@ -764,8 +775,9 @@ class ScoreboardData:
         self.decisions = PitcherDecisions(game=self.game)
         self.matchup = Matchup(game=self.game)
         self.count = Count(game=self.game)
-        self.away = Team(game=self.game, team='away')
-        self.home = Team(game=self.game, team='home')
+        standings = {}
+        self.away = Team(game=self.game, team='away', standings=standings)
+        self.home = Team(game=self.game, team='home', standings=standings)
         self.pitch_details = PitchDetails(game=self.game)
         self.hit_details = HitDetails(game=self.game)
         self.run_expectancy = RunExpectancy(game=self.game)
@@ -794,7 +806,8 @@ class ScoreboardData:
 
         new_game.check_postponed()
 
-        self.__dict__.update(new_game.__dict__)
+        for attr, value in zip(ScoreboardData.__slots__, _get_slots(new_game)):
+            setattr(self, attr, value)
 
         return new_game
 
@@ -807,10 +820,12 @@ class ScoreboardData:
             dict: The difference between the current ScoreboardData object
         """
 
-        old_game = copy.deepcopy(self)
+        # to_dict builds new dictionaries and update replaces the
+        # attributes instead of changing them so no copy is needed
+        old_dict = self.to_dict()
         new_game = self.update(delay_seconds=delay_seconds)
 
-        diff = dict_diff(old_game.to_dict(), new_game.to_dict())
+        diff = dict_diff(old_dict, new_game.to_dict())
 
         return diff
 
@@ -820,25 +835,14 @@ class ScoreboardData:
         Returns:
             dict: Dictionary representation of the ScoreboardData object
         """
-        return {'gamepk': self.gamepk,
-                'game_state': self.game_state,
-                'start_time': self.start_time,
-                'inning': self.inning,
-                'inning_state': self.inning_state,
-                'away': self.away.to_dict(),
-                'home': self.home.to_dict(),
-                'probables': self.probables.to_dict(),
-                'decisions': self.decisions.to_dict(),
-                'matchup': self.matchup.to_dict(),
-                'count': self.count.to_dict(),
-                'pitch_details': self.pitch_details.to_dict(),
-                'hit_details': self.hit_details.to_dict(),
-                'run_expectancy': self.run_expectancy.to_dict(),
-                'win_probability': self.win_probability.to_dict(),
-                'umpire': self.umpire.to_dict(),
-                'batting_order': self.batting_order.to_dict(),
-                'flags': self.flags.to_dict(),
-                'runners': self.runners}
+        data = dict(zip(_DICT_VALUES, _get_dict_values(self)))
+
+        for key, child in zip(_DICT_CHILDREN, _get_dict_children(self)):
+            data[key] = child.to_dict()
+
+        data['runners'] = self.runners
+
+        return data
 
     def check_postponed(self):
         """
@@ -866,6 +870,17 @@ class ScoreboardData:
     def __repr__(self):
         return f'{self.away.abv} {self.away.runs} @ {self.home.abv} {self.home.runs}'
 
+# Attributes in ScoreboardData.to_dict() in order. Values are copied as
+# is and children are converted with their own to_dict()
+_DICT_VALUES = ('gamepk', 'game_state', 'start_time', 'inning', 'inning_state')
+_DICT_CHILDREN = ('away', 'home', 'probables', 'decisions', 'matchup', 'count',
+                  'pitch_details', 'hit_details', 'run_expectancy',
+                  'win_probability', 'umpire', 'batting_order', 'flags')
+
+_get_slots = operator.attrgetter(*ScoreboardData.__slots__)
+_get_dict_values = operator.attrgetter(*_DICT_VALUES)
+_get_dict_children = operator.attrgetter(*_DICT_CHILDREN)
+
 if __name__ == '__main__':
     x = ScoreboardData(gamepk=745455)
     print(json.dumps(x.to_dict(), indent=4))
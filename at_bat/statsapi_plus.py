@@ -5,11 +5,38 @@ more appropriate modules
 """
 
 import csv
-from typing import List
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+import functools
+from typing import List, Tuple
 import os
+import requests
+from requests.adapters import HTTPAdapter
 import statsapi
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional, requests' json decoder is used instead
+    orjson = None
+
+GAME_URL = 'https://statsapi.mlb.com/api/v1.1/game/{gamepk}/feed/live'
+
+# One session for every live feed request so the connection to the
+# server is kept alive between polls instead of reconnecting each time
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+_SESSION.headers.update({'Accept-Encoding': 'gzip'})
+
+# max number of games get_game_dict keeps the last response for. Enough
+# for every game on a full day of the schedule
+GAME_DICT_CACHE_SIZE = 16
+
+# gamepk -> (ETag, game dict) of the last response for each game
+_game_dict_cache: 'OrderedDict[int, Tuple[str, dict]]' = OrderedDict()
+
 def get_daily_gamepks(date: str = None) -> List[int]:
     """
     Returns a list of gamePks for a given day in ISO 8601 format
@@ -43,6 +70,59 @@ def get_daily_gamepks(date: str = None) -> List[int]:
 
     return gamePks
 
+def get_game_dict(gamepk: int, delay_seconds: float = 0) -> dict:
+    """
+    Returns the live feed for a given game, the same dictionary as
+    statsapi.get('game'). The ETag of the last response is sent back
+    with If-None-Match so when nothing has changed the server answers
+    304 Not Modified and the previously parsed dictionary is returned
+    instead of downloading and parsing the feed again. Only the last
+    GAME_DICT_CACHE_SIZE games are kept. The feed is decoded with
+    orjson if it is installed
+
+    Args:
+        gamepk (int): gamePk for the desired game
+        delay_seconds (float, optional): Number of seconds behind the
+            live feed. Defaults to 0
+
+    Returns:
+        dict: The game data for the given gamePk
+
+    Raises:
+        requests.HTTPError: If the request fails
+    """
+    params = {}
+    if delay_seconds:
+        delay_time = datetime.now(timezone.utc) - timedelta(seconds=delay_seconds)
+        params['timecode'] = delay_time.strftime('%Y%m%d_%H%M%S')
+
+    headers = {}
+    cached = _game_dict_cache.get(gamepk, None)
+    if cached is not None:
+        headers['If-None-Match'] = cached[0]
+
+    response = _SESSION.get(GAME_URL.format(gamepk=gamepk), params=params,
+                             headers=headers, timeout=10)
+
+    if response.status_code == 304 and cached is not None:
+        _game_dict_cache.move_to_end(gamepk)
+        return cached[1]
+
+    response.raise_for_status()
+    if orjson is not None:
+        data = orjson.loads(response.content)
+    else:
+        data = response.json()
+
+    etag = response.headers.get('ETag', None)
+    if etag is not None:
+        _game_dict_cache[gamepk] = (etag, data)
+        _game_dict_cache.move_to_end(gamepk)
+        if len(_game_dict_cache) > GAME_DICT_CACHE_SIZE:
+            _game_dict_cache.popitem(last=False)
+
+    return data
+
 def get_re288_dataframe() -> pd.DataFrame:
     """
     Returns the re288.csv file as a pandas DataFrame
@@ -69,6 +149,100 @@ def get_re640_dataframe() -> pd.DataFrame:
 
     return pd.read_csv(csv_file_path)
 
+@functools.lru_cache(maxsize=1)
+def get_re640_numpy() -> np.ndarray:
+    """
+    Returns the re640.csv runs scored distribution as a numpy array so
+    that a game state can be looked up by index instead of filtering
+    the DataFrame. The file is only read the first time this function
+    is called
+
+    Index as re640[balls, strikes, outs, runners] where runners is the
+    integer representation of the bases from int(Runners). Each state
+    holds how many times 0 to 13 runs were scored the rest of the
+    inning. The count is the sum and the average runs is the weighted
+    average
+
+    Memory maps the prebuilt every_pitch_csv/re640.npy if it exists,
+    otherwise builds the array from the csv. See build_numpy_tables
+
+    Returns:
+        np.ndarray: Array of shape (5, 4, 4, 8, 14) of run counts
+    """
+    return _load_numpy_table('re640', _re640_numpy_from_csv)
+
+def _runners_column(df: pd.DataFrame) -> pd.Series:
+    """
+    Returns the is_first_base, is_second_base, and is_third_base
+    columns of a table packed into the integer representation of the
+    bases from int(Runners)
+    """
+    return (df['is_first_base'].astype(int)
+            + 2 * df['is_second_base'].astype(int)
+            + 4 * df['is_third_base'].astype(int))
+
+def _re640_numpy_from_csv() -> np.ndarray:
+    """Builds the array returned by get_re640_numpy from re640.csv"""
+    df = get_re640_dataframe()
+    re640 = np.zeros((5, 4, 4, 8, 14), dtype=np.float32)
+
+    runners = _runners_column(df)
+
+    runs = df[[f'{i} runs' for i in range(14)]].to_numpy()
+    re640[df['balls'], df['strikes'], df['outs'], runners] = runs
+
+    return re640
+
+@functools.lru_cache(maxsize=1)
+def get_re640_flat() -> np.ndarray:
+    """
+    Returns the summary of the re640 runs scored distribution for every
+    game state as one contiguous float32 table. Each row is a game
+    state, look a row up with re_lookup so it is a single index instead
+    of indexing balls, strikes, outs, and runners one at a time
+
+    Each row is [count, average_runs, 1+ runs, 2+ runs, 3+ runs,
+    4+ runs] where the last four are the chance of scoring at least
+    that many runs the rest of the inning. Every column is 0 for game
+    states that were never seen
+
+    Returns:
+        np.ndarray: Array of shape (640, 6) of run expectancy values
+    """
+    re640 = get_re640_numpy()
+    runs = re640.reshape(-1, re640.shape[-1])
+    count = runs.sum(axis=1)
+    seen = np.where(count == 0, 1, count)
+
+    # at_least[:, i] is the number of times i or more runs scored
+    at_least = runs[:, ::-1].cumsum(axis=1)[:, ::-1]
+
+    flat = np.zeros((runs.shape[0], 6), dtype=np.float32)
+    flat[:, 0] = count
+    flat[:, 1] = (runs * np.arange(runs.shape[1])).sum(axis=1) / seen
+    flat[:, 2:] = at_least[:, 1:5] / seen[:, None]
+
+    return flat
+
+def re_lookup(flat: np.ndarray, balls: int, strikes: int, outs: int,
+              runners: int) -> np.ndarray:
+    """
+    Returns the row of get_re640_flat for the given game state
+
+    Args:
+        flat (np.ndarray): Table from get_re640_flat
+        balls (int): Balls in the count, 0 to 4
+        strikes (int): Strikes in the count, 0 to 3
+        outs (int): Number of outs, 0 to 3
+        runners (int): Integer representation of the bases from
+            int(Runners), 0 to 7
+
+    Returns:
+        np.ndarray: [count, average_runs, 1+ runs, 2+ runs, 3+ runs,
+            4+ runs] for the game state
+    """
+    return flat[((balls * 4 + strikes) * 4 + outs) * 8 + runners]
+
 def get_wp780800_dataframe() -> pd.DataFrame:
     """
     Returns the wp780800.csv file as a pandas DataFrame
@@ -108,6 +282,110 @@ def get_red288_dataframe() -> pd.DataFrame:
 
     return pd.read_csv(csv_file_path)
 
+@functools.lru_cache(maxsize=1)
+def get_red288_numpy() -> np.ndarray:
+    """
+    Returns the red288.csv run values as a numpy array so that a game
+    state can be looked up by index instead of filtering the DataFrame
+
+    Index as red288[balls, strikes, outs, runners] where runners is the
+    integer representation of the bases from int(Runners)
+
+    Memory maps the prebuilt every_pitch_csv/red288.npy if it exists,
+    otherwise builds the array from the csv. See build_numpy_tables
+
+    Returns:
+        np.ndarray: Array of shape (4, 3, 3, 8) of run values
+    """
+    return _load_numpy_table('red288', _red288_numpy_from_csv)
+
+def _red288_numpy_from_csv() -> np.ndarray:
+    """Builds the array returned by get_red288_numpy from red288.csv"""
+    df = get_red288_dataframe()
+    red288 = np.zeros((4, 3, 3, 8), dtype=np.float32)
+
+    runners = _runners_column(df)
+
+    red288[df['balls'], df['strikes'], df['outs'], runners] = df['run_value']
+
+    return red288
+
+@functools.lru_cache(maxsize=1)
+def get_wpd351360_numpy() -> np.ndarray:
+    """
+    Returns the wpd351360.csv win probability deltas as a numpy array
+    so that a game state can be looked up by index instead of filtering
+    the DataFrame
+
+    Index as wpd351360[balls, strikes, outs, runners, inning - 1,
+    is_top_inning, home_lead + 30] where runners is the integer
+    representation of the bases from int(Runners) and inning is capped
+    at 10
+
+    Memory maps the prebuilt every_pitch_csv/wpd351360.npy if it
+    exists, otherwise builds the array from the csv. See build_numpy_tables
+
+    Returns:
+        np.ndarray: Array of shape (4, 3, 3, 8, 10, 2, 61) of wpa values
+    """
+    return _load_numpy_table('wpd351360', _wpd351360_numpy_from_csv)
+
+def _wpd351360_numpy_from_csv() -> np.ndarray:
+    """Builds the array returned by get_wpd351360_numpy from the csv"""
+    df = get_wpd351360_dataframe()
+    wpd351360 = np.zeros((4, 3, 3, 8, 10, 2, 61), dtype=np.float32)
+
+    runners = _runners_column(df)
+
+    wpd351360[df['balls'], df['strikes'], df['outs'], runners,
+              df['inning'] - 1, df['is_top_inning'].astype(int),
+              df['home_lead'] + 30] = df['wpa']
+
+    return wpd351360
+
+def _numpy_table_path(name: str) -> str:
+    """Returns the path of the prebuilt .npy file for the given table"""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_dir, '..', 'every_pitch_csv', f'{name}.npy')
+
+def _load_numpy_table(name: str, from_csv) -> np.ndarray:
+    """
+    Memory maps the prebuilt .npy file for the given table so the csv
+    does not need to be parsed. Falls back to building the array from
+    the csv with from_csv if the file has not been built or the csv was
+    modified after it was built
+
+    Args:
+        name (str): Name of the table, same as the csv without .csv
+        from_csv (Callable[[], np.ndarray]): Builds the array from the
+            csv file
+
+    Returns:
+        np.ndarray: The table, read only if it was memory mapped
+    """
+    npy_path = _numpy_table_path(name)
+    csv_path = os.path.splitext(npy_path)[0] + '.csv'
+    if (os.path.exists(npy_path)
+            and os.path.getmtime(npy_path) >= os.path.getmtime(csv_path)):
+        return np.load(npy_path, mmap_mode='r')
+
+    return from_csv()
+
+def build_numpy_tables():
+    """
+    Saves the re640, red288, and wpd351360 numpy arrays next to their
+    csv files as .npy files so get_*_numpy can memory map them instead
+    of parsing the csv files. Run again whenever the csv files change
+    """
+    tables = {
+        're640': _re640_numpy_from_csv,
+        'red288': _red288_numpy_from_csv,
+        'wpd351360': _wpd351360_numpy_from_csv,
+    }
+
+    for name, from_csv in tables.items():
+        np.save(_numpy_table_path(name), from_csv())
+
 def find_division_from_id() -> str:
     """
     Returns the division of a team given the team_id
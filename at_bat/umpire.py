@@ -19,14 +19,23 @@ num_miss, favor, missed_list = Umpire.find_missed_calls(gamePk = 717404,
 """
 
 import csv
+import json
 import os
-from typing import List, Tuple, Union
-import random
-import math
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Union
 import copy
+import numpy as np
 from at_bat.game import Game, AllPlays, PlayEvents
 from at_bat.runners import Runners
-from at_bat.statsapi_plus import get_red288_dataframe, get_wpd351360_dataframe
+from at_bat.statsapi_plus import get_red288_numpy, get_wpd351360_numpy
+
+try:
+    from at_bat.umpire_numba import (monte_carlo_correct_calls,
+                                     buffer_zone_missed_calls)
+except ImportError:
+    # numba is optional, numpy version is used instead
+    monte_carlo_correct_calls = None
+    buffer_zone_missed_calls = None
 
 # center of ball needs to be .6870488261 hawkeye margin of errors away
 # from the edge of the strike zone for the 90% rule to apply
@@ -42,6 +51,172 @@ HAWKEYE_MARGIN_OF_ERROR_FEET = HAWKEYE_MARGIN_OF_ERROR_INCH/12
 BUFFER_INCH = .325
 BUFFER_FEET = BUFFER_INCH / 12
 
+# number of simulated pitch locations used for the Monte Carlo method
+MONTE_CARLO_SIMULATIONS = 500
+
+# max number of games get_umpire_summary keeps results for
+UMPIRE_CACHE_SIZE = 64
+
+# Per at bat results of completed at bats are saved to
+# DISK_CACHE_DIR/{gamepk}.json so they are not calculated again in
+# later runs. Bump the schema version whenever the calculation changes
+# so files from older versions are ignored. Files saved with different
+# method settings (see _disk_cache_settings) are ignored as well
+DISK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'mlb_stats')
+SCHEMA_VERSION = 3
+
+# (num_missed, home_favor, home_wpa) returned by get_umpire_summary
+UmpireSummary = Tuple[int, float, float]
+
+# (gamepk, method) -> (game fingerprint, UmpireSummary)
+_UMPIRE_CACHE: 'OrderedDict[Tuple[int, str], Tuple[tuple, UmpireSummary]]' = OrderedDict()
+
+def _random_pitch_offsets(moe: float, num_simulations: int = MONTE_CARLO_SIMULATIONS
+                          ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the x and z offsets of the simulated pitch locations used
+    for the Monte Carlo method. The offsets are uniformly distributed
+    over a circle with a radius of the margin of error. The generator
+    is seeded so every pitch is simulated with the same offsets and the
+    results do not change between runs
+
+    Args:
+        moe (float): Margin of error in feet
+        num_simulations (int, optional): Number of simulated pitch
+            locations. Defaults to MONTE_CARLO_SIMULATIONS
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: dx and dz offsets in feet
+    """
+    rng = np.random.default_rng(0)
+    offsets = np.empty((0, 2))
+
+    # Sample the square around the circle and reject the corners
+    # (~21% of samples) until there are enough offsets
+    while len(offsets) < num_simulations:
+        xy = rng.uniform(-moe, moe, (num_simulations, 2))
+        xy = xy[(xy[:, 0] ** 2 + xy[:, 1] ** 2) <= moe ** 2]
+        offsets = np.concatenate((offsets, xy))
+
+    offsets = offsets[:num_simulations]
+
+    return (offsets[:, 0], offsets[:, 1])
+
+def _collect_pitches(game: Game, start: int = 0
+                     ) -> Dict[str, Union[np.ndarray, list]]:
+    """
+    Walks through every at bat in the game once and collects the called
+    pitches (called strikes and balls) into numpy arrays with one
+    element per pitch so missed calls can be found for the whole game
+    at once instead of one pitch at a time
+
+    The balls and strikes are the count before the pitch was thrown.
+    The runners are the int representation of Runners when the pitch
+    was thrown. The at_bat and pitch lists hold the AllPlays and
+    PlayEvents classes for each pitch so MissedCalls can be created
+
+    Args:
+        game (Game): The game to collect the pitches from
+        start (int, optional): Index in allPlays of the first at bat to
+            collect. Earlier at bats are skipped. Defaults to 0
+
+    Returns:
+        Dict[str, Union[np.ndarray, list]]: Pitch data for each called
+            pitch in the game
+    """
+    columns = {'is_strike': [], 'zone': [], 'is_valid': [],
+               'pX': [], 'pZ': [], 'pX_left': [], 'pX_right': [],
+               'pZ_top': [], 'pZ_bot': [], 'balls': [], 'strikes': [],
+               'outs': [], 'runners': [], 'inning': [], 'is_top_inning': [],
+               'home_lead': []}
+    at_bats: List[AllPlays] = []
+    pitches: List[PlayEvents] = []
+
+    runners = Runners()
+    all_plays = game.liveData.plays.allPlays
+
+    if start > 0:
+        # end_at_bat sets every base so the runners only depend on the
+        # at bat before start, same as walking through every at bat
+        runners.new_at_bat(all_plays[start - 1])
+        runners.end_at_bat(all_plays[start - 1])
+
+    for at_bat in all_plays[start:]:
+        runners.new_at_bat(at_bat)
+        isTopInning = at_bat.about.isTopInning
+        inning = min(at_bat.about.inning, 10)
+        home_lead = at_bat.result.homeScore - at_bat.result.awayScore
+
+        at_bat_last_pitch = len(at_bat.playEvents) - 1
+
+        # only events with a runner movement can change the runners
+        movement_indexes = {runner.details.playIndex for runner in at_bat.runners}
+        runners_int = int(runners)
+
+        for pitch in at_bat.playEvents:
+            if pitch.index != at_bat_last_pitch and pitch.index in movement_indexes:
+                # check for steals
+                # might not be accurate when running live?
+                runners.process_runner_movement(at_bat.runners, pitch.index)
+                runners_int = int(runners)
+
+            if pitch.isPitch is False or pitch.pitchData is None:
+                continue
+
+            code = pitch.details.code
+            if code not in ('C', 'B'):
+                continue
+
+            coordinates = pitch.pitchData.coordinates
+            is_valid = coordinates is not None and coordinates.is_valid()
+            zone = pitch.pitchData.zone
+
+            columns['is_strike'].append(code == 'C')
+            columns['zone'].append(zone if zone is not None else -1)
+            columns['is_valid'].append(is_valid)
+            columns['pX'].append(coordinates.pX if is_valid else np.nan)
+            columns['pZ'].append(coordinates.pZ if is_valid else np.nan)
+            columns['pX_left'].append(coordinates.PX_MIN if is_valid else np.nan)
+            columns['pX_right'].append(coordinates.PX_MAX if is_valid else np.nan)
+            columns['pZ_top'].append(coordinates.pZ_max if is_valid else np.nan)
+            columns['pZ_bot'].append(coordinates.pZ_min if is_valid else np.nan)
+            columns['balls'].append(pitch.count.balls - (code == 'B'))
+            columns['strikes'].append(pitch.count.strikes - (code == 'C'))
+            columns['outs'].append(pitch.count.outs)
+            columns['runners'].append(runners_int)
+            columns['inning'].append(inning)
+            columns['is_top_inning'].append(isTopInning)
+            columns['home_lead'].append(home_lead)
+
+            at_bats.append(at_bat)
+            pitches.append(pitch)
+
+        runners.end_at_bat(at_bat)
+
+    # explicit dtypes so a game without called pitches still works
+    dtypes = {'is_strike': bool, 'is_valid': bool, 'is_top_inning': bool,
+              'zone': np.int64, 'balls': np.int64, 'strikes': np.int64,
+              'outs': np.int64, 'runners': np.int64, 'inning': np.int64,
+              'home_lead': np.int64}
+    collected = {key: np.array(value, dtype=dtypes.get(key, np.float64))
+                 for key, value in columns.items()}
+    collected['at_bat'] = at_bats
+    collected['pitch'] = pitches
+
+    return collected
+
+def _in_buffer_np(pX: np.ndarray, pZ: np.ndarray, pX_left: np.ndarray,
+                  pX_right: np.ndarray, pZ_top: np.ndarray,
+                  pZ_bot: np.ndarray, buf: float) -> np.ndarray:
+    """Vectorized version of Umpire._is_correct_call_buffer_zone"""
+    outer = (((pX_left - buf) <= pX) & (pX <= (pX_right + buf)) &
+             ((pZ_bot - buf) <= pZ) & (pZ <= (pZ_top + buf)))
+
+    inner = (((pX_left + buf) < pX) & (pX < (pX_right - buf)) &
+             ((pZ_bot + buf) < pZ) & (pZ < (pZ_top - buf)))
+
+    return outer & ~inner
+
 class MissedCalls():
     """
     Class that represents a missed call made by the umpire in a game
@@ -136,8 +311,11 @@ class Umpire():
             instance class initialized
     """
     hmoe = HAWKEYE_MARGIN_OF_ERROR_FEET
-    red288 = get_red288_dataframe()
-    wpd351360 = get_wpd351360_dataframe()
+    # float32 and C-contiguous so the tables can be passed to the numba
+    # kernels without a conversion
+    rednp = np.ascontiguousarray(get_red288_numpy(), dtype=np.float32)
+    wpdnp = np.ascontiguousarray(get_wpd351360_numpy(), dtype=np.float32)
+    monte_dx, monte_dz = _random_pitch_offsets(HAWKEYE_MARGIN_OF_ERROR_FEET)
 
     def __init__(self, game: Union[Game, None] = None,
         gamepk: Union[int, None] = None, delay_seconds: int = 0,
@@ -159,7 +337,6 @@ class Umpire():
         self.home_favor: float = 0
         self.home_wpa: float = 0
         self.method: str = method
-        self._runners = Runners()
 
     def calculate_game(self, method: str = None):
         """
@@ -184,51 +361,104 @@ class Umpire():
         if method is not None:
             self.method = method
 
-        for at_bat in self.game.liveData.plays.allPlays:
-            self._runners.new_at_bat(at_bat)
-            isTopInning = at_bat.about.isTopInning
+        if self.method not in ('zone', 'monte', 'buffer'):
+            raise ValueError('method should be zone, monte, or buffer')
 
-            at_bat_last_pitch = len(at_bat.playEvents) - 1
+        pitches = _collect_pitches(self.game)
+        missed, home_favor, home_wpa = Umpire.delta_favor_pitches(pitches, self.method)
 
-            for pitch in at_bat.playEvents:
-                if pitch.index != at_bat_last_pitch:
-                    # check for steals
-                    # might not be accurate when running live?
-                    self._runners.process_runner_movement(at_bat.runners, pitch.index)
+        for i in np.flatnonzero(missed):
+            runners_int = int(pitches['runners'][i])
+            runners = Runners()
+            runners.set_bases([bool(runners_int & 1), bool(runners_int & 2),
+                               bool(runners_int & 4)])
 
-                if pitch.isPitch is True:
-                    self._process_pitch(at_bat, pitch, isTopInning)
-
-            self._runners.end_at_bat(at_bat)
+            self.num_missed_calls += 1
+            self.home_favor += float(home_favor[i])
+            self.home_wpa += float(home_wpa[i])
+            self.missed_calls.append(MissedCalls(len(self.missed_calls),
+                                     pitches['at_bat'][i], pitches['pitch'][i],
+                                     runners, float(home_favor[i]),
+                                     float(home_wpa[i])))
 
-    def _process_pitch(self, at_bat: AllPlays, pitch: PlayEvents, is_top_inning: bool):
-        runners_int = int(self._runners)
-        is_first_base = bool(runners_int & 1)
-        is_second_base = bool(runners_int & 2)
-        is_third_base = bool(runners_int & 4)
+    @classmethod
+    def delta_favor_pitches(cls, pitches: Dict[str, np.ndarray], method: str
+                            ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized version of delta_favor_single_pitch that calculates
+        the missed calls for every pitch returned by _collect_pitches
+        at once
 
-        inning = at_bat.about.inning
-        is_top_inning = at_bat.about.isTopInning
-        home_lead = at_bat.result.homeScore - at_bat.result.awayScore
+        Args:
+            pitches (Dict[str, np.ndarray]): Pitches from _collect_pitches
+            method (str): 'zone', 'monte', or 'buffer'. See
+                delta_favor_single_pitch for more info
 
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Boolean mask of
+                missed calls, home favor, and home wpa for each pitch.
+                Home favor and home wpa are 0 for correct calls
+        """
+        is_strike = pitches['is_strike']
+        zone = pitches['zone']
 
-        home_delta: Tuple =  Umpire.delta_favor_single_pitch(pitch, is_top_inning,
-                                is_first_base, is_second_base, is_third_base,
-                                inning, home_lead, self.method)
+        # zone is -1 when it is missing. Zones 1-9 are strikes and
+        # 11-14 are balls, there is no zone 10
+        in_zone = (zone >= 1) & (zone <= 9)
+        has_zone = in_zone | (zone > 10)
+        wrong = has_zone & (in_zone ^ is_strike)
 
-        if home_delta == 0:
-            # Bodge because I don't want to change the return type
-            home_favor_delta = 0
-            home_wpa_delta = 0
+        if method == 'zone':
+            missed = wrong
+        elif method == 'monte':
+            if monte_carlo_correct_calls is not None:
+                correct = monte_carlo_correct_calls(is_strike,
+                            pitches['pX'], pitches['pZ'],
+                            pitches['pX_left'], pitches['pX_right'],
+                            pitches['pZ_top'], pitches['pZ_bot'],
+                            cls.monte_dx, cls.monte_dz)
+            else:
+                correct = cls._is_correct_call_monte_carlo_np(is_strike,
+                            pitches['pX'], pitches['pZ'],
+                            pitches['pX_left'], pitches['pX_right'],
+                            pitches['pZ_top'], pitches['pZ_bot'])
+            missed = pitches['is_valid'] & ~correct
+        elif method == 'buffer':
+            if buffer_zone_missed_calls is not None:
+                missed = buffer_zone_missed_calls(wrong, pitches['is_valid'],
+                            pitches['pX'], pitches['pZ'],
+                            pitches['pX_left'], pitches['pX_right'],
+                            pitches['pZ_top'], pitches['pZ_bot'], BUFFER_FEET)
+            else:
+                in_buf = _in_buffer_np(pitches['pX'], pitches['pZ'],
+                                       pitches['pX_left'], pitches['pX_right'],
+                                       pitches['pZ_top'], pitches['pZ_bot'],
+                                       BUFFER_FEET)
+                missed = pitches['is_valid'] & ~in_buf & wrong
         else:
-            home_favor_delta, home_wpa_delta = home_delta
+            raise ValueError('method should be zone, monte, or buffer')
 
-        if home_favor_delta != 0:
-            self.num_missed_calls += 1
-            self.home_favor += home_favor_delta
-            self.home_wpa += home_wpa_delta
-            self.missed_calls.append(MissedCalls(len(self.missed_calls), at_bat, pitch,
-                                     self._runners, home_favor_delta, home_wpa_delta))
+        balls = pitches['balls']
+        strikes = pitches['strikes']
+        outs = pitches['outs']
+        runners = pitches['runners']
+        inning = pitches['inning']
+        is_top_inning = pitches['is_top_inning']
+        home_lead = np.clip(pitches['home_lead'], -30, 30)
+
+        run_value = cls.rednp[balls, strikes, outs, runners]
+        wpa = cls.wpdnp[balls, strikes, outs, runners, inning - 1,
+                        is_top_inning.astype(int), home_lead + 30]
+
+        # +1 for called strikes and -1 for balls, flipped again for the
+        # bottom of the inning for the run value. 0 for correct calls
+        call_signs = np.where(is_strike, 1.0, -1.0) * missed
+        inning_signs = np.where(is_top_inning, 1.0, -1.0)
+
+        home_favor = run_value * call_signs * inning_signs
+        home_wpa = wpa * call_signs
+
+        return (missed, home_favor, home_wpa)
 
     def print_missed_calls(self):
         """
@@ -259,51 +489,6 @@ class Umpire():
         home_team = self.game.gameData.teams.home.abbreviation
         return f'+{self.home_favor:.2f} {home_team}'
 
-    @classmethod
-    def _missed_pitch_details(cls, at_bat: AllPlays, runners: Runners,
-                              pitch: PlayEvents, home_delta: float, i: int
-                              ) -> str:
-        """Helper method to find_missed_calls"""
-        to_print_str = ''
-
-        half_inn = at_bat.about.halfInning.capitalize()
-        inning = at_bat.about.inning
-        pitcher_name = at_bat.matchup.pitcher.fullName
-        batter_name = at_bat.matchup.batter.fullName
-
-        to_print_str += f'{i}: {half_inn} {inning}\n'
-        to_print_str += f'{pitcher_name} to {batter_name}\n'
-
-        if pitch.count.outs == 1:
-            to_print_str += f'{pitch.count.outs} out, '
-        else:
-            to_print_str += f'{pitch.count.outs} outs, '
-
-        to_print_str += f'{str(runners)}\n'
-
-        balls = pitch.count.balls
-        strikes = pitch.count.strikes
-
-        if pitch.details.code == 'C':
-            to_print_str += f'{balls}-{strikes-1}, ball called strike\n'
-        elif pitch.details.code == 'B':
-            to_print_str += f'{balls-1}-{strikes}, strike called ball\n'
-
-        to_print_str += f'Zone: {pitch.pitchData.zone}\n'
-
-        to_print_str += (f'pX = {pitch.pitchData.coordinates.pX:.5f} | '
-                        f'pZ = {pitch.pitchData.coordinates.pZ:.5f}\n')
-
-        to_print_str += (f'left: {pitch.pitchData.coordinates.PX_MIN:.5f} | '
-                         f'right: {pitch.pitchData.coordinates.PX_MAX:.5f}\n')
-
-        to_print_str += (f'bot = {pitch.pitchData.coordinates.pZ_bot:.5f} | '
-                        f'top = {pitch.pitchData.coordinates.pZ_top:.5f}\n')
-
-        to_print_str += f'Home Favor: {home_delta:4.2f}\n'
-
-        return to_print_str
-
     @classmethod
     def delta_favor_single_pitch(cls, pitch: PlayEvents, isTopInning: bool,
         is_first_base: bool, is_second_base: bool, is_third_base: bool,
@@ -358,29 +543,29 @@ class Umpire():
             method (str, optional): _description_. Defaults to None.
 
         Raises:
-            TypeError: If isTopInning argument is not type bool
+            ValueError: If method is not 'zone', 'monte', or 'buffer'
 
         Returns:
             float: The amount of runs the umpire gave for  pitch. 0 if
                 pitch is swung or correct call was made.
         """
 
-        if isinstance(isTopInning, bool) is False:
-            raise TypeError('isTopInning should be type bool')
-
-        if pitch.pitchData is None:
+        # swings, fouls, and balls in play are most pitches
+        if pitch.details.code not in ('C', 'B'):
             return 0
 
+        assert isinstance(isTopInning, bool), 'isTopInning should be type bool'
+
         if method not in ('zone', 'monte', 'buffer'):
             raise ValueError('method should be zone, monte, or buffer')
 
+        if pitch.pitchData is None:
+            return 0
+
         balls = pitch.count.balls
         strikes = pitch.count.strikes
         outs = pitch.count.outs
 
-        if pitch.details.code not in ('C', 'B'):
-            return 0
-
         if method == 'zone':
             correct = Umpire._is_correct_call_zone_num(pitch)
         if method == 'monte':
@@ -390,7 +575,8 @@ class Umpire():
         if method == 'buffer':
             if Umpire._check_valid_pitch(pitch) is False:
                 return 0
-            correct = Umpire._is_correct_call_buffer_zone(pitch)
+            correct = (Umpire._is_correct_call_buffer_zone(pitch) or
+                       Umpire._is_correct_call_zone_num(pitch))
 
         if correct is True:
             return 0
@@ -402,40 +588,23 @@ class Umpire():
 
         inning = min(inning, 10)
 
-        state_runs = (
-            (Umpire.red288['balls'] == balls) &
-            (Umpire.red288['strikes'] == strikes) &
-            (Umpire.red288['outs'] == outs) &
-            (Umpire.red288['is_first_base'] == is_first_base) &
-            (Umpire.red288['is_second_base'] == is_second_base) &
-            (Umpire.red288['is_third_base'] == is_third_base)
-        )
-
-        state_wpa = (
-            (Umpire.wpd351360['balls'] == balls) &
-            (Umpire.wpd351360['strikes'] == strikes) &
-            (Umpire.wpd351360['outs'] == outs) &
-            (Umpire.wpd351360['is_first_base'] == is_first_base) &
-            (Umpire.wpd351360['is_second_base'] == is_second_base) &
-            (Umpire.wpd351360['is_third_base'] == is_third_base) &
-            (Umpire.wpd351360['inning'] == inning) &
-            (Umpire.wpd351360['is_top_inning'] == isTopInning) &
-            (Umpire.wpd351360['home_lead'] == home_lead)
-        )
-
-        home_win = Umpire.wpd351360[state_wpa]['wpa'].iloc[0]
+        runners = is_first_base + 2 * is_second_base + 4 * is_third_base
+        home_lead = min(max(home_lead, -30), 30)
+
+        run_value = cls.rednp[balls, strikes, outs, runners]
+        home_win = cls.wpdnp[balls, strikes, outs, runners, inning - 1,
+                             int(isTopInning), home_lead + 30]
 
         if pitch.details.code == 'C':
-            home_favor = Umpire.red288[state_runs]['run_value'].iloc[0]
+            home_favor = run_value
             home_wpa = home_win
 
         if pitch.details.code == 'B':
-            home_favor = -1 * Umpire.red288[state_runs]['run_value'].iloc[0]
+            home_favor = -1 * run_value
             home_wpa = -1 * home_win
 
-        if isTopInning is True:
-            return (home_favor, home_wpa)
-        return (-1 * home_favor, home_wpa)
+        sign = 1 if isTopInning else -1
+        return (sign * home_favor, home_wpa)
 
     @classmethod
     def _check_valid_pitch(cls, pitch):
@@ -457,31 +626,49 @@ class Umpire():
     @classmethod
     def _is_correct_call_monte_carlo(cls, pitch: PlayEvents) -> bool:
         """Helper method to delta_favor_zone"""
-        random.seed(0)
+        coordinates = pitch.pitchData.coordinates
 
-        strike = 0
-        ball = 0
+        correct = cls._is_correct_call_monte_carlo_np(
+            np.array([pitch.details.code == 'C']),
+            np.array([coordinates.pX]), np.array([coordinates.pZ]),
+            np.array([coordinates.PX_MIN]), np.array([coordinates.PX_MAX]),
+            np.array([coordinates.pZ_max]), np.array([coordinates.pZ_min]))
 
-        pX_left = pitch.pitchData.coordinates.PX_MIN
-        pX_right = pitch.pitchData.coordinates.PX_MAX
-        pZ_top = pitch.pitchData.coordinates.pZ_max
-        pZ_bot = pitch.pitchData.coordinates.pZ_min
+        return bool(correct[0])
 
-        for _ in range(1, 501):
-            rand_x, rand_z = Umpire._generage_random_pitch_location(pitch)
+    @classmethod
+    def _is_correct_call_monte_carlo_np(cls, is_strike: np.ndarray,
+            pX: np.ndarray, pZ: np.ndarray, pX_left: np.ndarray,
+            pX_right: np.ndarray, pZ_top: np.ndarray, pZ_bot: np.ndarray
+            ) -> np.ndarray:
+        """
+        Vectorized version of _is_correct_call_monte_carlo. Simulates
+        every pitch at once as an array of shape
+        (num_pitches, MONTE_CARLO_SIMULATIONS)
 
-            if pX_left <= rand_x <= pX_right and pZ_bot <= rand_z <= pZ_top:
-                strike += 1
-            else:
-                ball += 1
+        Returns:
+            np.ndarray: True for each pitch that was called correctly
+        """
+        # Measure from the center of the zone so each axis is a single
+        # comparison against half the zone size
+        half_w = (pX_right - pX_left) * 0.5
+        mid_x = (pX_right + pX_left) * 0.5
+        half_h = (pZ_top - pZ_bot) * 0.5
+        mid_z = (pZ_top + pZ_bot) * 0.5
 
-        total = ball + strike
+        rand_x = (pX - mid_x)[:, np.newaxis] + cls.monte_dx
+        rand_z = (pZ - mid_z)[:, np.newaxis] + cls.monte_dz
 
-        if pitch.details.code == 'B' and ((strike / total) > 0.90):
-            return False
-        if pitch.details.code =='C' and ((ball / total) > 0.90):
-            return False
-        return True
+        strike = ((np.abs(rand_x) <= half_w[:, np.newaxis]) &
+                  (np.abs(rand_z) <= half_h[:, np.newaxis]))
+
+        strike_frac = strike.mean(axis=1)
+        ball_frac = 1 - strike_frac
+
+        wrong = ((~is_strike & (strike_frac > 0.90)) |
+                 (is_strike & (ball_frac > 0.90)))
+
+        return ~wrong
 
     @classmethod
     def _is_correct_call_buffer_zone(cls, pitch: PlayEvents) -> bool:
@@ -490,67 +677,191 @@ class Umpire():
         pX = pitch.pitchData.coordinates.pX
         pZ = pitch.pitchData.coordinates.pZ
 
-        pZ_top = pitch.pitchData.coordinates.pZ_top
-        pZ_bot = pitch.pitchData.coordinates.pZ_bot
+        pZ_top = pitch.pitchData.coordinates.pZ_max
+        pZ_bot = pitch.pitchData.coordinates.pZ_min
 
         pX_left = pitch.pitchData.coordinates.PX_MIN
         pX_right = pitch.pitchData.coordinates.PX_MAX
 
-        # left zone
-        if (((pX_left - buf) <= pX <= (pX_left + buf)) and
-            ((pZ_bot - buf) <= pZ <= (pZ_top + buf))):
-            return True
+        # The pitch is in the buffer zone if it is inside the strike
+        # zone grown by the buffer but not inside the strike zone
+        # shrunk by the buffer
+        x_lo = pX_left - buf
+        x_hi = pX_right + buf
+        z_lo = pZ_bot - buf
+        z_hi = pZ_top + buf
 
-        # right zone
-        if (((pX_right - buf) <= pX <= (pX_right + buf)) and
-            ((pZ_bot - buf) <= pZ <= (pZ_top + buf))):
-            return True
+        left_hi = pX_left + buf
+        right_lo = pX_right - buf
+        bot_hi = pZ_bot + buf
+        top_lo = pZ_top - buf
 
-        # top zone
-        if (((pZ_top - buf) <= pZ <= (pZ_top + buf)) and
-            ((pX_left - buf) <= pX <= (pX_right + buf))):
-            return True
+        return ((x_lo <= pX <= x_hi) and (z_lo <= pZ <= z_hi) and
+                not ((left_hi < pX < right_lo) and (bot_hi < pZ < top_lo)))
 
-        # bottom zone
-        if (((pZ_bot - buf) <= pZ <= (pZ_bot + buf)) and
-            (pX_left - buf) <= pX <= (pX_right + buf)):
-            return True
+def _game_fingerprint(game: Game) -> Tuple[int, int, str]:
+    """
+    Cheap fingerprint of the pitches in a game. If the fingerprint has
+    not changed, the missed calls have not changed either. Final games
+    cannot change so they all share the same fingerprint
+    """
+    if game.gameData.status.game_state == 'F':
+        return (-1, -1, 'F')
 
-        return False
+    all_plays = game.liveData.plays.allPlays
+    num_pitches = len(all_plays[-1].playEvents) if all_plays else 0
+    return (len(all_plays), num_pitches, game.gameData.status.statusCode)
 
-    @classmethod
-    def _generage_random_pitch_location(cls, pitch: PlayEvents
-                                        ) -> Tuple[float, float]:
-        """Helper method to delta_favor_zone"""
+def get_umpire_summary(game: Game, method: str = 'monte') -> Tuple[int, float, float]:
+    """
+    Returns the number of missed calls, home favor, and home wpa for
+    the given game. Results are cached per game so refreshing a game
+    that has not had a new pitch skips calculating the whole game again.
+    Completed at bats are also cached on disk, see _summarize_game
 
-        pX = pitch.pitchData.coordinates.pX
-        pZ = pitch.pitchData.coordinates.pZ
+    Args:
+        game (Game): The game to calculate the missed calls for
+        method (str, optional): Method used to calculate missed calls.
+            See Umpire.delta_favor_single_pitch. Defaults to 'monte'
 
-        delta_radius = random.uniform(-cls.hmoe, cls.hmoe)
-        angle = random.uniform(0, 360)
-        angle = math.radians(angle)
+    Returns:
+        Tuple[int, float, float]: num_missed_calls, home_favor, home_wpa
+    """
+    key = (game.gamepk, method)
+    fingerprint = _game_fingerprint(game)
 
-        dx = delta_radius * math.cos(angle)
-        dz = delta_radius * math.sin(angle)
+    cached = _UMPIRE_CACHE.get(key, None)
+    if cached is not None and cached[0] == fingerprint:
+        _UMPIRE_CACHE.move_to_end(key)
+        return cached[1]
 
-        rand_x = pX + dx
-        rand_z = pZ + dz
+    summary = _summarize_game(game, method)
 
-        return (rand_x, rand_z)
+    _UMPIRE_CACHE[key] = (fingerprint, summary)
+    _UMPIRE_CACHE.move_to_end(key)
+    if len(_UMPIRE_CACHE) > UMPIRE_CACHE_SIZE:
+        _UMPIRE_CACHE.popitem(last=False)
 
-    @classmethod
-    def _check_class_methods(cls, runners: Union[Runners, None],
-            runners_int: Union[int, None], isTopInning: bool) -> int:
-        if runners is None and runners_int is None:
-            raise ValueError('runners and runners_int were not provided')
-        if isinstance(runners_int, int) is False and runners_int is not None:
-            raise TypeError('runners_int should be type int')
-        if isinstance(isTopInning, bool) is False:
-            raise TypeError('isTopInning should be type bool')
-
-        if runners is not None:
-            return int(runners)
-        return runners_int
+    return summary
+
+def _summarize_game(game: Game, method: str) -> Tuple[int, float, float]:
+    """
+    Returns the number of missed calls, home favor, and home wpa for
+    the given game. Completed at bats already in the disk cache are
+    not calculated again, only the at bats after the last cached one
+    are. Completed at bats that were calculated are added to the cache
+
+    Args:
+        game (Game): The game to calculate the missed calls for
+        method (str): Method used to calculate missed calls
+
+    Returns:
+        Tuple[int, float, float]: num_missed_calls, home_favor, home_wpa
+    """
+    if method not in ('zone', 'monte', 'buffer'):
+        raise ValueError('method should be zone, monte, or buffer')
+
+    all_plays = game.liveData.plays.allPlays
+    cache = _load_disk_cache(game.gamepk)
+    cached = cache.setdefault(method, {})
+
+    # at bats are cached in order so skip to the first one not cached.
+    # An at bat still in progress in this game is calculated even if it
+    # is cached, the cache can be ahead of a delayed view of the game
+    start = 0
+    while (start < len(all_plays) and all_plays[start].about.isComplete is True
+           and str(all_plays[start].atBatIndex) in cached):
+        start += 1
+
+    pitches = _collect_pitches(game, start=start)
+    missed, home_favor, home_wpa = Umpire.delta_favor_pitches(pitches, method)
+
+    # position of each pitch's at bat counting from start
+    positions = {at_bat.atBatIndex: i for i, at_bat in enumerate(all_plays[start:])}
+    at_bat_i = np.array([positions[at_bat.atBatIndex] for at_bat in pitches['at_bat']],
+                        dtype=np.int64)
+    num_new = len(all_plays) - start
+
+    new_missed = np.bincount(at_bat_i, weights=missed, minlength=num_new)
+    new_favor = np.bincount(at_bat_i, weights=home_favor, minlength=num_new)
+    new_wpa = np.bincount(at_bat_i, weights=home_wpa, minlength=num_new)
+
+    # only the cached at bats in this game, the cache can be ahead of
+    # it when the game is viewed with a delay
+    previous = [cached[str(at_bat.atBatIndex)] for at_bat in all_plays[:start]]
+    num_missed = sum(value[0] for value in previous)
+    favor = sum(value[1] for value in previous)
+    wpa = sum(value[2] for value in previous)
+
+    changed = False
+    for i, at_bat in enumerate(all_plays[start:]):
+        num_missed += int(new_missed[i])
+        favor += float(new_favor[i])
+        wpa += float(new_wpa[i])
+
+        if at_bat.about.isComplete is True:
+            cached[str(at_bat.atBatIndex)] = [int(new_missed[i]),
+                                              float(new_favor[i]),
+                                              float(new_wpa[i])]
+            changed = True
+
+    if changed is True:
+        _save_disk_cache(game.gamepk, cache)
+
+    return (num_missed, favor, wpa)
+
+def _disk_cache_path(gamepk: int) -> str:
+    """Returns the path of the disk cache file for the given game"""
+    return os.path.join(DISK_CACHE_DIR, f'{gamepk}.json')
+
+def _disk_cache_settings() -> Dict[str, Union[int, float]]:
+    """
+    Returns the settings the missed calls depend on. Saved with the disk
+    cache so changing one of them invalidates the saved results
+    """
+    return {'hawkeye_margin_of_error_feet': HAWKEYE_MARGIN_OF_ERROR_FEET,
+            'buffer_feet': BUFFER_FEET,
+            'monte_carlo_simulations': MONTE_CARLO_SIMULATIONS}
+
+def _load_disk_cache(gamepk: int) -> Dict[str, Dict[str, List[Union[int, float]]]]:
+    """
+    Returns the per at bat results saved for the given game as
+    {method: {atBatIndex: [num_missed, home_favor, home_wpa]}}. Returns
+    an empty cache if there is no file, it can not be read, or it was
+    saved with a different SCHEMA_VERSION or different method settings
+    """
+    try:
+        with open(_disk_cache_path(gamepk), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get('schema_version', None) != SCHEMA_VERSION:
+        return {}
+
+    if data.get('settings', None) != _disk_cache_settings():
+        return {}
+
+    return data.get('at_bats', {})
+
+def _save_disk_cache(gamepk: int, cache: Dict[str, Dict[str, List[Union[int, float]]]]):
+    """
+    Saves the per at bat results for the given game. The file is
+    written to a temporary file first so a reader never sees half of
+    it. Failing to write the cache is not an error
+    """
+    path = _disk_cache_path(gamepk)
+    temp_path = f'{path}.tmp'
+
+    try:
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'schema_version': SCHEMA_VERSION,
+                       'settings': _disk_cache_settings(),
+                       'at_bats': cache}, f)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
 
 def sv_top_bot(gamePk: int):
     """
@@ -0,0 +1,106 @@
+"""
+Module holds Numba compiled versions of the Monte Carlo and buffer
+zone calculations in the umpire module. Numba is optional. If it is
+not installed the umpire module falls back to the numpy versions.
+
+Functions:
+    monte_carlo_correct_calls: Compiled version of
+        Umpire._is_correct_call_monte_carlo_np
+    buffer_zone_missed_calls: Compiled version of the buffer zone
+        check in Umpire.delta_favor_pitches
+"""
+
+import numpy as np
+from numba import njit, prange # pylint: disable=E0401
+
+@njit(parallel=True, cache=True)
+def monte_carlo_correct_calls(is_strike: np.ndarray, pX: np.ndarray,
+        pZ: np.ndarray, pX_left: np.ndarray, pX_right: np.ndarray,
+        pZ_top: np.ndarray, pZ_bot: np.ndarray, dx: np.ndarray,
+        dz: np.ndarray) -> np.ndarray:
+    """
+    Simulates each pitch location with the given offsets and returns if
+    the umpire made the correct call. Loops over the pitches in
+    parallel instead of building a (num_pitches, num_simulations) array
+
+    Args:
+        is_strike (np.ndarray): True if the pitch was a called strike
+        pX (np.ndarray): Horizontal pitch location
+        pZ (np.ndarray): Vertical pitch location
+        pX_left (np.ndarray): Left edge for the center of the ball
+        pX_right (np.ndarray): Right edge for the center of the ball
+        pZ_top (np.ndarray): Top edge for the center of the ball
+        pZ_bot (np.ndarray): Bottom edge for the center of the ball
+        dx (np.ndarray): Horizontal offsets of the simulated locations
+        dz (np.ndarray): Vertical offsets of the simulated locations
+
+    Returns:
+        np.ndarray: True for each pitch that was called correctly
+    """
+    num_pitches = pX.shape[0]
+    num_simulations = dx.shape[0]
+    correct = np.ones(num_pitches, dtype=np.bool_)
+
+    for i in prange(num_pitches): # pylint: disable=E1133
+        strike = 0
+
+        # Measure from the center of the zone like the numpy version
+        half_w = (pX_right[i] - pX_left[i]) * 0.5
+        half_h = (pZ_top[i] - pZ_bot[i]) * 0.5
+        cx = pX[i] - (pX_right[i] + pX_left[i]) * 0.5
+        cz = pZ[i] - (pZ_top[i] + pZ_bot[i]) * 0.5
+
+        for j in range(num_simulations):
+            if abs(cx + dx[j]) <= half_w and abs(cz + dz[j]) <= half_h:
+                strike += 1
+
+        strike_frac = strike / num_simulations
+        ball_frac = 1 - strike_frac
+
+        if is_strike[i] and ball_frac > 0.90:
+            correct[i] = False
+        elif not is_strike[i] and strike_frac > 0.90:
+            correct[i] = False
+
+    return correct
+
+@njit(cache=True)
+def buffer_zone_missed_calls(wrong: np.ndarray, is_valid: np.ndarray,
+        pX: np.ndarray, pZ: np.ndarray, pX_left: np.ndarray,
+        pX_right: np.ndarray, pZ_top: np.ndarray, pZ_bot: np.ndarray,
+        buf: float) -> np.ndarray:
+    """
+    Checks each wrong call against the buffer around the edges of the
+    strike zone in a single pass and returns the pitches that were
+    missed. Wrong calls inside the buffer zone are not counted as missed
+
+    Args:
+        wrong (np.ndarray): True if the call does not match the zone
+            number. Built by Umpire.delta_favor_pitches
+        is_valid (np.ndarray): True if the pitch has valid coordinates
+        pX (np.ndarray): Horizontal pitch location
+        pZ (np.ndarray): Vertical pitch location
+        pX_left (np.ndarray): Left edge for the center of the ball
+        pX_right (np.ndarray): Right edge for the center of the ball
+        pZ_top (np.ndarray): Top edge for the center of the ball
+        pZ_bot (np.ndarray): Bottom edge for the center of the ball
+        buf (float): Size of the buffer zone in feet
+
+    Returns:
+        np.ndarray: True for each pitch that was a missed call
+    """
+    num_pitches = pX.shape[0]
+    missed = np.zeros(num_pitches, dtype=np.bool_)
+
+    for i in range(num_pitches):
+        if not (is_valid[i] and wrong[i]):
+            continue
+
+        outer = (pX_left[i] - buf <= pX[i] <= pX_right[i] + buf and
+                 pZ_bot[i] - buf <= pZ[i] <= pZ_top[i] + buf)
+        inner = (pX_left[i] + buf < pX[i] < pX_right[i] - buf and
+                 pZ_bot[i] + buf < pZ[i] < pZ_top[i] - buf)
+
+        missed[i] = not (outer and not inner)
+
+    return missed
@@ -0,0 +1,15 @@
+"""
+Saves the re640, red288, and wpd351360 csv files created by the
+previous modules as .npy files. at_bat.statsapi_plus memory maps the
+.npy files instead of parsing the csv files every time the tables are
+loaded. Run this module again whenever one of the csv files changes.
+"""
+
+from at_bat.statsapi_plus import build_numpy_tables
+
+def main():
+    build_numpy_tables()
+    print('done')
+
+if __name__ == '__main__':
+    main()
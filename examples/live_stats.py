@@ -6,27 +6,49 @@ You can find the gamePk for a given game by going to the 'Gameday'
 section of the desired game and by looking for a string of 6 consecutive
 numbers in the url.
 
+Classes:
+    Renderer: Where the live stats are drawn
+    PlainRenderer: Prints the live stats to stdout
+    CursesRenderer: Draws the live stats to a full screen curses window
+
 Functions:
-    print_last_pitch(gamePk, delay_seconds): Prints live stats for the
-        given game based off the gamePk argument with a delay in
-        seconds if delay_seconds argument is provided
+    print_last_pitch(gamePk, delay_seconds, renderer): Prints live
+        stats for the given game based off the gamePk argument with a
+        delay in seconds if delay_seconds argument is provided
     main(): Gets gamePk and delay_seconds from command line arguments
         and prompts user for input if either command line argument is
         provided
 """
 
-import curses
-import argparse
-from typing import Tuple
-from at_bat.game import Game, PlayEvents, AllPlays
-from at_bat.statsapi_plus import get_game_dict, get_re640_dataframe
-from at_bat.umpire import Umpire
+from abc import ABC, abstractmethod
+import queue
+import sys
+import threading
+from typing import List, Optional, Tuple, Union
+import numpy as np
+from at_bat.game import Game, PlayEvents, AllPlays, Matchup
+from at_bat.statsapi_plus import get_game_dict, get_re640_flat, re_lookup
+from at_bat.umpire import get_umpire_summary
 from at_bat.runners import Runners
 from at_bat.fifo import FIFO
+from at_bat.cli import parse_gamepk
+
+# Seconds between requests. Starts at the minimum after a new pitch
+# and backs off to the maximum while nothing changes. Games that are
+# not live (pre-game, delayed, final) are checked every idle seconds
+POLL_MIN_SECONDS = 2
+POLL_MAX_SECONDS = 15
+POLL_IDLE_SECONDS = 60
 
-re640 = get_re640_dataframe()
+# Seconds between requests while waiting for the first pitch of an at
+# bat. Nothing is drawn until then so the backoff above is skipped
+POLL_GAP_SECONDS = 1
 
-def print_last_pitch(gamePk: int = None, delay_seconds: float = 0):
+# Seconds between checks for the quit key while waiting for a game
+QUIT_CHECK_SECONDS = 0.1
+
+def print_last_pitch(gamePk: int = None, delay_seconds: float = 0,
+                     renderer: Optional['Renderer'] = None):
     """
     Prints the following for the latest pitch:
 
@@ -50,143 +72,300 @@ def print_last_pitch(gamePk: int = None, delay_seconds: float = 0):
         delay (float, optional): The numbers of seconds you want the
             output to be delayed. Useful so that pitch info does not
             show up before pitch is thrown on TV. Defaults to 0
+        renderer (Renderer, optional): Where the output is drawn.
+            Defaults to a full screen curses window. Press q to quit
     """
     print(f'gamePk: {gamePk}, delay: {delay_seconds}')
 
     if gamePk is None:
         raise ValueError('gamePk not provided')
 
-    clr = ' ' * 40
-
-    god = curses.initscr()
-    god.clear()
-    fifo = FIFO(5)
-
-    while True:
-        game = Game(get_game_dict(gamepk=gamePk, delay_seconds=delay_seconds))
-        at_bat = game.liveData.plays.allPlays[-1]
-
-        if fifo.contains(at_bat) is False:
-            fifo.push(at_bat)
+    try:
+        if renderer is not None:
+            _run(renderer, gamePk, delay_seconds)
+        else:
+            # only pulled in when drawing to a terminal
+            import curses # pylint: disable=C0415
+            curses.wrapper(lambda god: _run(CursesRenderer(god), gamePk,
+                                            delay_seconds))
+    except KeyboardInterrupt:
+        # curses.wrapper has already restored the terminal
+        pass
+
+class Renderer(ABC):
+    """
+    Draws the lines from _render_lines somewhere. _run only calls draw
+    when the lines have changed since the last draw
+    """
+    @abstractmethod
+    def draw(self, lines: List[str]):
+        """
+        Draws the given lines, replacing the previous draw
+
+        Args:
+            lines (List[str]): Lines from _render_lines
+        """
+
+    def quit_requested(self) -> bool:
+        """
+        Returns True if the user asked to stop. Checked about every
+        QUIT_CHECK_SECONDS
+        """
+        return False
+
+class PlainRenderer(Renderer):
+    """
+    Prints each draw to stdout. Used when stdout is not a terminal and
+    handy for testing the draw loop without curses
+    """
+    def draw(self, lines: List[str]):
+        print('\n'.join(lines), flush=True)
 
-            if len(at_bat.playEvents) > 0:
-                pitch = at_bat.playEvents[-1]
+class CursesRenderer(Renderer):
+    """
+    Draws to a curses window, replacing the previous draw. Press q to
+    quit
+    """
+    def __init__(self, god: 'curses.window'):
+        import curses # pylint: disable=C0415
+
+        try:
+            curses.use_default_colors()
+        except curses.error:
+            # terminal does not support colors
+            pass
+
+        self.god = god
+        self.god.nodelay(True)
+        self.god.clear()
+
+    def draw(self, lines: List[str]):
+        # one write for the whole block. curses still only sends the
+        # cells that differ
+        self.god.erase()
+        self.god.addstr(0, 0, '\n'.join(lines))
+        self.god.refresh()
+
+    def quit_requested(self) -> bool:
+        return self.god.getch() == ord('q')
+
+def _run(renderer: Renderer, gamePk: int, delay_seconds: float):
+    """
+    Draw loop for print_last_pitch. Games are fetched by a background
+    thread so the renderer keeps responding while a request is in
+    flight
 
-                i = 0
-                for line in _get_game_details(game, at_bat):
-                    god.addstr(i, 0, f'{line} {clr}')
-                    i += 1
+    Args:
+        renderer (Renderer): Where the lines are drawn
+        gamePk (int): The gamePk for the desired game
+        delay_seconds (float): Seconds the output is delayed by
+    """
+    fifo = FIFO(5)
+    re640 = get_re640_flat()
 
-                for line in _get_at_bat_details(at_bat, pitch):
-                    god.addstr(i, 0, f'{line} {clr}')
-                    i += 1
+    prev_lines: List[str] = []
 
-                i += 1
-                for line in _get_run_details(at_bat, pitch):
-                    god.addstr(i, 0, f'{line} {clr}')
-                    i += 1
+    games: 'queue.Queue[Union[Game, Exception]]' = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    fetcher = threading.Thread(target=_fetcher,
+                               args=(gamePk, delay_seconds, games, stop),
+                               daemon=True)
+    fetcher.start()
 
-                i += 1
-                for line in _get_umpire_details(game):
-                    god.addstr(i, 0, f'{line} {clr}')
-                    i += 1
+    try:
+        while renderer.quit_requested() is False:
+            try:
+                game = games.get(timeout=QUIT_CHECK_SECONDS)
+            except queue.Empty:
+                continue
 
-                i += 1
-                for line in _get_pitch_details(pitch):
-                    god.addstr(i, 0, f'{line} {clr}')
-                    i += 1
+            if isinstance(game, Exception):
+                raise game
 
-                i += 1
-                for line in _get_hit_details(pitch):
-                    god.addstr(i, 0, f'{line} {clr}')
-                    i += 1
+            at_bat = game.liveData.plays.allPlays[-1]
 
-                god.refresh()
+            if fifo.contains(at_bat) is False:
+                fifo.push(at_bat)
 
+                # _fetcher only sends games with at least one pitch
+                pitch = at_bat.playEvents[-1]
 
-def _get_game_details(game: Game, at_bat: AllPlays) -> Tuple[str, str]:
-    away_team = game.gameData.teams.away.teamName
-    away_score = at_bat.result.awayScore
-    home_team = game.gameData.teams.home.teamName
-    home_score = at_bat.result.homeScore
+                lines = _render_lines(game, at_bat, pitch, re640)
 
-    half_inn = at_bat.about.halfInning.capitalize()
-    inning = at_bat.about.inning
+                if lines != prev_lines:
+                    renderer.draw(lines)
+                    prev_lines = lines
+    finally:
+        stop.set()
 
-    line_0 = f'{away_team} ({away_score}) at {home_team} ({home_score})'
-    line_1 = f'{half_inn} {inning}'
-    return (line_0, line_1)
+def _fetcher(gamePk: int, delay_seconds: float,
+             games: 'queue.Queue[Union[Game, Exception]]',
+             stop: threading.Event):
+    """
+    Polls the live feed until stop is set and puts each game on the
+    queue, replacing a game that has not been drawn yet. Polls every
+    POLL_MIN_SECONDS after a new pitch and backs off to
+    POLL_MAX_SECONDS while nothing changes. Games without a pitch yet
+    are not put on the queue. If a request fails the
+    exception is put on the queue instead so the draw loop raises it
 
+    Args:
+        gamePk (int): The gamePk for the desired game
+        delay_seconds (float): Seconds the output is delayed by
+        games (queue.Queue): Queue the draw loop reads from
+        stop (threading.Event): Set by the draw loop when it exits
+    """
+    interval = POLL_MIN_SECONDS
+    last_pitch_id = None
+
+    while not stop.is_set():
+        try:
+            game = Game(get_game_dict(gamepk=gamePk,
+                                      delay_seconds=delay_seconds))
+        except Exception as e: # pylint: disable=W0718
+            _put_latest(games, e)
+            return
+
+        if not (all_plays := game.liveData.plays.allPlays):
+            # game has not started yet
+            stop.wait(POLL_IDLE_SECONDS)
+            continue
+
+        at_bat = all_plays[-1]
+        if not (events := at_bat.playEvents):
+            # between batters so there is nothing new to draw but the
+            # first pitch is usually close if the game is live
+            if game.gameData.status.game_state == 'L':
+                stop.wait(POLL_GAP_SECONDS)
+            else:
+                stop.wait(POLL_IDLE_SECONDS)
+            continue
+
+        pitch_id = (at_bat.atBatIndex, len(events))
+        if pitch_id != last_pitch_id:
+            last_pitch_id = pitch_id
+            interval = POLL_MIN_SECONDS
+        else:
+            interval = min(interval * 1.5, POLL_MAX_SECONDS)
+
+        _put_latest(games, game)
+
+        if game.gameData.status.game_state == 'L':
+            stop.wait(interval)
+        else:
+            stop.wait(POLL_IDLE_SECONDS)
+
+def _put_latest(games: queue.Queue, item):
+    """
+    Puts item on a queue of size one, dropping the item already on it.
+    Only safe with a single producer like _fetcher
+    """
+    try:
+        games.get_nowait()
+    except queue.Empty:
+        pass
 
-def _get_at_bat_details(at_bat: AllPlays,
-                        pitch: PlayEvents) -> Tuple[str, str, str]:
-    pitcher = at_bat.matchup.pitcher.fullName
-    batter = at_bat.matchup.batter.fullName
+    games.put(item)
 
-    balls = pitch.count.balls
-    strikes = pitch.count.strikes
-    outs = pitch.count.outs
+def _render_lines(game: Game, at_bat: AllPlays, pitch: PlayEvents,
+                  re640: np.ndarray) -> List[str]:
+    """
+    Returns every line print_last_pitch draws for the given pitch in
+    order. Empty strings are the blank lines between sections
+    """
+    teams = game.gameData.teams
+    result = at_bat.result
+    about = at_bat.about
+    matchup = at_bat.matchup
+    count = pitch.count
+    details = pitch.details
+
+    runners = _runners_int(matchup)
+
+    lines = [
+        f'{teams.away.teamName} ({result.awayScore}) at '
+        f'{teams.home.teamName} ({result.homeScore})',
+        f'{about.halfInning.capitalize()} {about.inning}',
+        f'{matchup.pitcher.fullName} to {matchup.batter.fullName}',
+        f'{count.balls}-{count.strikes} | {count.outs} Outs',
+        Runners.runners_str(runners).capitalize(),
+        '',
+        *_get_run_details(pitch, runners, re640),
+        '',
+        *_get_umpire_details(game),
+        '',
+        'Pitch Details: ',
+        f'{details.description}',
+    ]
+
+    # Some games (mostly MiLB) do not track every pitch so pitchData,
+    # its breaks, or the pitch type can be missing on a pitch
+    pitch_data = pitch.pitchData if pitch.isPitch is True else None
+
+    if pitch_data is not None:
+        breaks = pitch_data.breaks
+        pitch_type = details.type
+
+        lines += [
+            f'{pitch_data.startSpeed} '
+            f'{pitch_type.description if pitch_type else ""}',
+            f'Zone: {pitch_data.zone}',
+        ]
+
+        if breaks is not None:
+            lines += [
+                f'{breaks.spinRate} RPM',
+                f'dx: {breaks.breakHorizontal}',
+                f'idy: {breaks.breakVerticalInduced}',
+            ]
+        else:
+            lines += ['', '', '']
+    else:
+        lines += ['', '', '', '', '']
+
+    lines.append('')
+
+    hit_data = pitch.hitData
+    if hit_data is not None:
+        lines += [
+            'Hit Details:',
+            f'Exit Velo: {hit_data.launchSpeed}',
+            f'Launch Angle: {hit_data.launchAngle}',
+            f'Total Dist: {hit_data.totalDistance}',
+        ]
+    else:
+        lines += ['', '', '', '']
 
-    runners = Runners()
-    # end_batter method sets the runners which is why its used here
-    # might have errors with walks?
-    runners.end_at_bat(at_bat)
+    return lines
 
-    line_0 = f'{pitcher} to {batter}'
-    line_1 = f'{balls}-{strikes} | {outs} Outs'
-    line_2 = f'{str(runners).capitalize()}'
 
-    return (line_0, line_1, line_2)
+def _runners_int(matchup: Matchup) -> int:
+    """
+    Returns the bases after the at bat as the same integer as
+    int(Runners) without building a Runners instance
+    """
+    return ((matchup.postOnFirst is not None)
+            | (matchup.postOnSecond is not None) << 1
+            | (matchup.postOnThird is not None) << 2)
 
-def _get_run_details_state(at_bat: AllPlays, pitch: PlayEvents) -> bool:
+def _get_run_details(pitch: PlayEvents, runners: int, re640: np.ndarray
+                     ) -> Tuple[str, str, str, str, str]:
     balls = pitch.count.balls
     strikes = pitch.count.strikes
     outs = pitch.count.outs
-    runners = Runners()
-    runners.end_at_bat(at_bat)
-    runners = int(runners)
-
-    is_first_base = bool(runners & 1)
-    is_second_base = bool(runners & 2)
-    is_third_base = bool(runners & 4)
 
-    state = ((re640['balls'] == balls) &
-             (re640['strikes'] == strikes) &
-             (re640['outs'] == outs) &
-             (re640['is_first_base'] == is_first_base) &
-             (re640['is_second_base'] == is_second_base) &
-             (re640['is_third_base'] == is_third_base))
+    count, run_exp, *at_least = re_lookup(re640, balls, strikes, outs,
+                                          runners)
 
-    return state
-
-def _get_run_details(at_bat: AllPlays, pitch: PlayEvents
-                     ) -> Tuple[str, str, str, str, str, str]:
-
-    state = _get_run_details_state(at_bat, pitch)
-
-    run_exp = re640[state]['average_runs'].iloc[0]
-    count = re640[state]['count'].iloc[0]
-
-    runs = [0, 0, 0, 0] # 1+, 2+, 3+, 4+
-
-    for i in range(0, 14):
-        runs = re640[state][f'{i} runs'].iloc[0]
-
-        if i >= 1:
-            runs[0] += runs
-        if i >= 2:
-            runs[1] += runs
-        if i >= 3:
-            runs[2] += runs
-        if i >= 4:
-            runs[3] += runs
+    if count == 0:
+        return ('Expected Runs: -', '1+ Runs: -', '2+ Runs: -',
+                '3+ Runs: -', '4+ Runs: -')
 
     line_0 = f'Expected Runs: {run_exp:.2f}'
-    line_1 = f'1+ Runs: {runs[0] / count:.2f}'
-    line_2 = f'2+ Runs: {runs[1] / count:.2f}'
-    line_3 = f'3+ Runs: {runs[2] / count:.2f}'
-    line_4 = f'4+ Runs: {runs[3] / count:.2f}'
-
+    line_1 = f'1+ Runs: {at_least[0]:.2f}'
+    line_2 = f'2+ Runs: {at_least[1]:.2f}'
+    line_3 = f'3+ Runs: {at_least[2]:.2f}'
+    line_4 = f'4+ Runs: {at_least[3]:.2f}'
 
     return (line_0, line_1, line_2, line_3, line_4)
 
@@ -195,10 +374,9 @@ def _get_umpire_details(game: Game) -> Tuple[str, str]:
     away_team = game.gameData.teams.away.abbreviation
     home_team = game.gameData.teams.home.abbreviation
 
-    umpire = Umpire(game=game)
-    umpire.calculate_game('monte')
-    misses = umpire.num_missed_calls
-    favor = umpire.home_favor
+    # cached until a new pitch is thrown so only the first draw of
+    # each pitch goes through the whole game
+    misses, favor, _ = get_umpire_summary(game, method='monte')
 
     line_0 = f'Missed Calls: {misses}'
 
@@ -209,75 +387,16 @@ def _get_umpire_details(game: Game) -> Tuple[str, str]:
 
     return (line_0, line_1)
 
-def _get_pitch_details(pitch: PlayEvents) -> Tuple[str, str, str, str, str]:
-    if pitch.isPitch is True:
-        desc = pitch.details.description
-        speed = pitch.pitchData.startSpeed
-        pitch_type = pitch.details.type.description
-
-        dx = pitch.pitchData.breaks.breakHorizontal
-        idy = pitch.pitchData.breaks.breakVerticalInduced
-
-        line_0 = 'Pitch Details: '
-        line_1 = f'{desc}'
-        line_2 = f'{speed} {pitch_type}'
-        line_3 = f'Zone: {pitch.pitchData.zone}'
-        line_4 = f'{pitch.pitchData.breaks.spinRate} RPM'
-        line_5 = f'dx: {dx}'
-        line_6 = f'idy: {idy}'
-    else:
-        desc = pitch.details.description
-
-        line_0 = 'Pitch Details: '
-        line_1 = f'{desc}'
-        line_2 = ''
-        line_3 = ''
-        line_4 = ''
-        line_5 = ''
-        line_6 = ''
-
-    return (line_0, line_1, line_2, line_3, line_4, line_5, line_6)
-
-
-def _get_hit_details(pitch: PlayEvents) -> Tuple[str, str, str, str]:
-    if pitch.hitData is not None:
-        exit_velo = pitch.hitData.launchSpeed
-        launch_angle = pitch.hitData.launchAngle
-        distance = pitch.hitData.totalDistance
-
-        line_0 = 'Hit Details:'
-        line_1 = f'Exit Velo: {exit_velo}'
-        line_2 = f'Launch Angle: {launch_angle}'
-        line_3 = f'Total Dist: {distance}'
-    else:
-        line_0 = ''
-        line_1 = ''
-        line_2 = ''
-        line_3 = ''
-
-    return (line_0, line_1, line_2, line_3)
-
-
 def main():
     """
     Main function that grabs system arguments and runs code
     """
-    parser = argparse.ArgumentParser()
-    parser.add_argument('-g', '--gamepk', help = 'gamePk', type=int)
-    parser.add_argument('-d', '--delay', help='delay in seconds', type=int)
-    args = parser.parse_args()
+    gamePk, delay = parse_gamepk(with_delay=True)
 
-    if args.gamepk is not None:
-        gamePk = args.gamepk
-    else:
-        gamePk = int(input('gamePk: '))
-
-    if args.delay is not None:
-        delay = args.delay
-    else:
-        delay = float(input('delay: '))
+    # curses needs a terminal, print instead when output is piped
+    renderer = None if sys.stdout.isatty() else PlainRenderer()
 
-    print_last_pitch(gamePk=gamePk, delay_seconds=delay)
+    print_last_pitch(gamePk=gamePk, delay_seconds=delay, renderer=renderer)
 
 
 if __name__ == '__main__':
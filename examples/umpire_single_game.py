@@ -5,12 +5,12 @@ only be using this module if you are running it directly. If you need
 to import this module, think about importing directly from the umpire
 module.
 
-Can use --gamePk command line argument to skip input prompt
+Can use -g/--gamePk command line argument to skip input prompt
 """
 
-import argparse
 from at_bat.umpire import Umpire
 from at_bat.plotter import Plotter
+from at_bat.cli import parse_gamepk
 
 
 def main():
@@ -20,15 +20,7 @@ def main():
     favor. This function is essentially a front for
     src.umpire.get_total_favored_runs
     """
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--gamePk', '--gamepk', help='gamePk', type=int)
-
-    args = parser.parse_args()
-
-    if args.gamePk is None:
-        gamePk = int(input('gamePk: '))
-    else:
-        gamePk = args.gamePk
+    gamePk, _ = parse_gamepk()
 
     plotter = Plotter()
 
@@ -0,0 +1,14 @@
+# pylint: disable=C0111
+
+from at_bat.cli import parse_gamepk
+
+def test_parse_gamepk_arguments():
+    assert parse_gamepk(['--gamePk', '748534']) == (748534, None)
+    assert parse_gamepk(['-g', '748534', '-d', '30'],
+                        with_delay=True) == (748534, 30.0)
+
+def test_parse_gamepk_prompts(monkeypatch):
+    answers = iter(['748534', '2.5'])
+    monkeypatch.setattr('builtins.input', lambda prompt: next(answers))
+
+    assert parse_gamepk([], with_delay=True) == (748534, 2.5)
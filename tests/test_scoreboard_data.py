@@ -0,0 +1,85 @@
+# pylint: disable=C0111, W0621
+
+import json
+import os
+from types import SimpleNamespace
+import pytest
+from at_bat import scoreboard_data, umpire
+from at_bat.game import Game
+from at_bat.standings import Standings
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def open_json(name: str) -> dict:
+    with open(os.path.join(TEST_DIR, 'test_json', name), encoding='utf-8') as f:
+        return json.load(f)
+
+def team_record(team_id: int, wins: int) -> SimpleNamespace:
+    return SimpleNamespace(team=SimpleNamespace(id=team_id), wins=wins,
+                           losses=162 - wins, division_rank='1',
+                           games_back='-',
+                           streak=SimpleNamespace(streakCode='W2'))
+
+@pytest.fixture
+def leagues_fetched(tmp_path, monkeypatch):
+    game_dict = open_json('748534.json')
+    monkeypatch.setattr(Game, 'get_game_from_pk',
+                        classmethod(lambda cls, gamepk, delay_seconds=0:
+                                    Game(game_dict)))
+    monkeypatch.setattr(umpire, 'DISK_CACHE_DIR', str(tmp_path))
+
+    # Rangers (140) and D-backs (109)
+    division = SimpleNamespace(team_records=[team_record(140, 90),
+                                             team_record(109, 84)])
+    fetched = []
+
+    def get_standings(cls, league): # pylint: disable=W0613
+        fetched.append(league)
+        return SimpleNamespace(east=division, central=division, west=division)
+
+    monkeypatch.setattr(Standings, 'get_standings', classmethod(get_standings))
+    return fetched
+
+def flatten(data: dict, prefix: str = '') -> dict:
+    flat = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f'{prefix}{key}/'))
+        else:
+            flat[f'{prefix}{key}'] = value
+    return flat
+
+def test_to_dict_matches_snapshot(leagues_fetched):
+    data = scoreboard_data.ScoreboardData(gamepk=748534).to_dict()
+    expected = open_json('748534_scoreboard.json')
+
+    # start time is in the local timezone
+    data.pop('start_time')
+    expected.pop('start_time')
+
+    assert list(data) == list(expected)
+    assert flatten(json.loads(json.dumps(data))) == pytest.approx(flatten(expected))
+    assert leagues_fetched == ['AL', 'NL']
+
+def test_intra_league_game_fetches_standings_once(leagues_fetched, monkeypatch):
+    # pretend the D-backs are in the AL West with the Rangers
+    monkeypatch.setitem(scoreboard_data.division_from_id, 109, 'AW')
+
+    data = scoreboard_data.ScoreboardData(gamepk=748534).to_dict()
+
+    assert leagues_fetched == ['AL']
+    assert data['home']['wins'] == 84
+
+def test_update_return_difference(leagues_fetched, monkeypatch):
+    scoreboard = scoreboard_data.ScoreboardData(gamepk=748534)
+    assert not scoreboard.update_return_difference()
+
+    game_dict = open_json('748534.json')
+    game_dict['liveData']['linescore']['teams']['away']['hits'] = 10
+    monkeypatch.setattr(Game, 'get_game_from_pk',
+                        classmethod(lambda cls, gamepk, delay_seconds=0:
+                                    Game(game_dict)))
+
+    assert scoreboard.update_return_difference() == {'away': {'hits': 10}}
+    assert scoreboard.away.hits == 10
+    assert len(leagues_fetched) == 6
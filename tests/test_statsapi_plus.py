@@ -0,0 +1,110 @@
+# pylint: disable=C0111
+
+import json
+import os
+from collections import OrderedDict
+import numpy as np
+import pytest
+from at_bat import statsapi_plus
+from at_bat.game import Game
+
+class FakeResponse:
+    def __init__(self, status_code, data=None, etag=None):
+        self.status_code = status_code
+        self._data = data
+        self.content = json.dumps(data).encode()
+        self.headers = {'ETag': etag} if etag is not None else {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+def test_get_game_dict_etag(monkeypatch):
+    requests_sent = []
+    responses = [FakeResponse(200, {'gamePk': 1}, etag='"abc"'),
+                 FakeResponse(304)]
+
+    def fake_get(url, params=None, headers=None, timeout=None): # pylint: disable=W0613
+        requests_sent.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(statsapi_plus._SESSION, 'get', fake_get)
+    monkeypatch.setattr(statsapi_plus, '_game_dict_cache', OrderedDict())
+
+    first = statsapi_plus.get_game_dict(1)
+    second = statsapi_plus.get_game_dict(1)
+
+    assert first == {'gamePk': 1}
+    assert second is first
+    assert 'If-None-Match' not in requests_sent[0]
+    assert requests_sent[1]['If-None-Match'] == '"abc"'
+
+def test_re_lookup_matches_dataframe():
+    df = statsapi_plus.get_re640_dataframe()
+    flat = statsapi_plus.get_re640_flat()
+
+    # 1-2 count, 1 out, runner on second
+    row = df[(df['balls'] == 1) & (df['strikes'] == 2) & (df['outs'] == 1) &
+             ~df['is_first_base'] & df['is_second_base'] &
+             ~df['is_third_base']].iloc[0]
+
+    count, average_runs, to_score, *_ = statsapi_plus.re_lookup(flat, 1, 2,
+                                                                1, 2)
+
+    assert count == row['count']
+    assert average_runs == pytest.approx(row['average_runs'], abs=1e-5)
+    assert to_score == pytest.approx(1 - row['0 runs'] / row['count'],
+                                     abs=1e-5)
+
+@pytest.mark.parametrize('name', ['re640', 'red288', 'wpd351360'])
+def test_numpy_tables_match_csv(name):
+    from_npy = getattr(statsapi_plus, f'get_{name}_numpy')()
+    from_csv = getattr(statsapi_plus, f'_{name}_numpy_from_csv')()
+
+    assert from_npy.dtype == from_csv.dtype
+    # states that can not happen like 4-3 counts are nan in re640
+    assert np.array_equal(from_npy, from_csv, equal_nan=True)
+
+def test_load_numpy_table_ignores_stale_npy(tmp_path, monkeypatch):
+    npy_path = tmp_path / 'table.npy'
+    csv_path = tmp_path / 'table.csv'
+    np.save(npy_path, np.zeros(3, dtype=np.float32))
+    csv_path.write_text('value\n1\n1\n1\n')
+    monkeypatch.setattr(statsapi_plus, '_numpy_table_path',
+                        lambda name: str(tmp_path / f'{name}.npy'))
+
+    def from_csv():
+        return np.ones(3, dtype=np.float32)
+
+    # .npy built after the csv is used
+    os.utime(csv_path, (1000, 1000))
+    os.utime(npy_path, (2000, 2000))
+    assert not statsapi_plus._load_numpy_table('table', from_csv).any()
+
+    # csv edited after the .npy was built is used instead
+    os.utime(csv_path, (3000, 3000))
+    assert statsapi_plus._load_numpy_table('table', from_csv).all()
+
+def test_game_get_dict_uses_etag_cache(monkeypatch):
+    responses = [FakeResponse(200, {'gamePk': 2}, etag='"def"'),
+                 FakeResponse(304)]
+    monkeypatch.setattr(statsapi_plus._SESSION, 'get',
+                        lambda *args, **kwargs: responses.pop(0))
+    monkeypatch.setattr(statsapi_plus, '_game_dict_cache', OrderedDict())
+
+    first = Game.get_dict(gamepk=2)
+    assert Game.get_dict(gamepk=2) is first
+
+def test_get_game_dict_cache_size(monkeypatch):
+    monkeypatch.setattr(statsapi_plus._SESSION, 'get',
+                        lambda url, **kwargs: FakeResponse(200, {'url': url},
+                                                           etag='"x"'))
+    monkeypatch.setattr(statsapi_plus, '_game_dict_cache', OrderedDict())
+    monkeypatch.setattr(statsapi_plus, 'GAME_DICT_CACHE_SIZE', 2)
+
+    for gamepk in (1, 2, 3):
+        statsapi_plus.get_game_dict(gamepk)
+
+    assert list(statsapi_plus._game_dict_cache) == [2, 3]
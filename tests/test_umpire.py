@@ -0,0 +1,216 @@
+# pylint: disable=C0111
+
+import json
+import os
+import numpy as np
+import pytest
+from at_bat import umpire as umpire_module
+from at_bat.game import Game
+from at_bat.umpire import (Umpire, get_umpire_summary, _collect_pitches,
+                           _in_buffer_np, _UMPIRE_CACHE, BUFFER_FEET,
+                           HAWKEYE_MARGIN_OF_ERROR_FEET)
+
+def open_748534() -> Game:
+    test_dir = os.path.dirname(os.path.abspath(__file__))
+    j748534 = os.path.join(test_dir, 'test_json', '748534.json')
+
+    with open(j748534, encoding='utf-8') as f:
+        data = json.load(f)
+
+    return Game(data)
+
+@pytest.fixture(autouse=True)
+def disk_cache_dir(tmp_path, monkeypatch):
+    # every test starts without cached summaries in memory or on disk
+    _UMPIRE_CACHE.clear()
+    monkeypatch.setattr(umpire_module, 'DISK_CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+@pytest.mark.parametrize('method', ['zone', 'monte', 'buffer'])
+def test_calculate_game(method):
+    umpire = Umpire(game=open_748534(), method=method)
+    umpire.calculate_game()
+
+    assert umpire.num_missed_calls == 6
+    assert len(umpire.missed_calls) == 6
+    assert umpire.home_favor == pytest.approx(0.037077, abs=1e-5)
+    assert umpire.home_wpa == pytest.approx(0.045623, abs=1e-5)
+
+    first = umpire.missed_calls[0]
+    assert first.inning == 1
+    assert first.code == 'B'
+
+def synthetic_pitches(is_strike, zone, pX):
+    # pitches at the middle height of a 1.66ft x 2ft zone in a 0-0 count
+    # with the bases empty in the top of the first of a tie game
+    num = len(pX)
+    return {'is_strike': np.array(is_strike), 'zone': np.array(zone),
+            'is_valid': np.ones(num, dtype=bool), 'pX': np.array(pX),
+            'pZ': np.full(num, 2.5), 'pX_left': np.full(num, -0.83),
+            'pX_right': np.full(num, 0.83), 'pZ_top': np.full(num, 3.5),
+            'pZ_bot': np.full(num, 1.5), 'balls': np.zeros(num, dtype=int),
+            'strikes': np.zeros(num, dtype=int),
+            'outs': np.zeros(num, dtype=int),
+            'runners': np.zeros(num, dtype=int),
+            'inning': np.ones(num, dtype=int),
+            'is_top_inning': np.ones(num, dtype=bool),
+            'home_lead': np.zeros(num, dtype=int)}
+
+@pytest.mark.parametrize('use_numba', [True, False])
+def test_delta_favor_pitches_methods_differ(use_numba, monkeypatch):
+    if use_numba:
+        pytest.importorskip('at_bat.umpire_numba')
+    else:
+        monkeypatch.setattr(umpire_module, 'monte_carlo_correct_calls', None)
+        monkeypatch.setattr(umpire_module, 'buffer_zone_missed_calls', None)
+
+    moe = HAWKEYE_MARGIN_OF_ERROR_FEET
+    # 0.55 moe inside the edge is outside the buffer but ~17% of the
+    # simulated pitches still land outside the zone
+    edge_depth = 0.55 * moe
+    assert edge_depth > BUFFER_FEET
+
+    pitches = synthetic_pitches(
+        # called strike just outside the zone but inside the buffer
+        # called ball inside the zone near the Monte Carlo 90% edge
+        # called ball deep inside the zone
+        is_strike=[True, False, False], zone=[14, 6, 5],
+        pX=[0.83 + BUFFER_FEET / 2, 0.83 - edge_depth, 0.83 - 2 * moe])
+
+    zone, zone_favor, _ = Umpire.delta_favor_pitches(pitches, 'zone')
+    buffer, _, _ = Umpire.delta_favor_pitches(pitches, 'buffer')
+    monte, _, _ = Umpire.delta_favor_pitches(pitches, 'monte')
+
+    assert zone.tolist() == [True, True, True]
+    assert buffer.tolist() == [False, True, True]
+    assert monte.tolist() == [False, False, True]
+    # in the top of the inning a missed strike helps the home team
+    # and a missed ball helps the away team
+    assert zone_favor[0] > 0 > zone_favor[1]
+
+def test_calculate_game_invalid_method():
+    umpire = Umpire(game=open_748534(), method='bad')
+
+    with pytest.raises(ValueError):
+        umpire.calculate_game()
+
+def test_monte_carlo_numba_matches_numpy():
+    umpire_numba = pytest.importorskip('at_bat.umpire_numba')
+    pitches = _collect_pitches(open_748534())
+
+    args = (pitches['is_strike'], pitches['pX'], pitches['pZ'],
+            pitches['pX_left'], pitches['pX_right'],
+            pitches['pZ_top'], pitches['pZ_bot'])
+
+    correct_np = Umpire._is_correct_call_monte_carlo_np(*args)
+    correct_numba = umpire_numba.monte_carlo_correct_calls(*args,
+                        Umpire.monte_dx, Umpire.monte_dz)
+
+    valid = pitches['is_valid']
+    assert (correct_np[valid] == correct_numba[valid]).all()
+
+def test_get_umpire_summary_cached():
+    game = open_748534()
+
+    summary = get_umpire_summary(game, method='zone')
+    assert summary[0] == 6
+    assert summary[1] == pytest.approx(0.037077, abs=1e-5)
+
+    assert _UMPIRE_CACHE[(748534, 'zone')][1] == summary
+    assert get_umpire_summary(game, method='zone') is summary
+
+def test_buffer_zone_numba_matches_numpy():
+    umpire_numba = pytest.importorskip('at_bat.umpire_numba')
+    pitches = _collect_pitches(open_748534())
+
+    bounds = (pitches['pX'], pitches['pZ'], pitches['pX_left'],
+              pitches['pX_right'], pitches['pZ_top'], pitches['pZ_bot'])
+
+    is_strike = pitches['is_strike']
+    zone = pitches['zone']
+    wrong = ((is_strike & (zone > 10)) |
+             (~is_strike & (zone >= 1) & (zone <= 9)))
+    missed_np = (pitches['is_valid'] & wrong &
+                 ~_in_buffer_np(*bounds, BUFFER_FEET))
+
+    missed_numba = umpire_numba.buffer_zone_missed_calls(wrong,
+                        pitches['is_valid'], *bounds, BUFFER_FEET)
+
+    assert (missed_np == missed_numba).all()
+
+def test_get_umpire_summary_disk_cache(disk_cache_dir, monkeypatch):
+    game = open_748534()
+    summary = get_umpire_summary(game, method='buffer')
+
+    with open(disk_cache_dir / '748534.json', encoding='utf-8') as f:
+        saved = json.load(f)
+
+    assert saved['schema_version'] == umpire_module.SCHEMA_VERSION
+    assert len(saved['at_bats']['buffer']) == len(game.liveData.plays.allPlays)
+
+    # every at bat is complete so nothing is collected the second time
+    collected = []
+    def collect(game, start=0):
+        collected.append(start)
+        return _collect_pitches(game, start)
+
+    monkeypatch.setattr(umpire_module, '_collect_pitches', collect)
+    _UMPIRE_CACHE.clear()
+
+    cached = get_umpire_summary(game, method='buffer')
+    assert cached[0] == summary[0]
+    assert cached[1] == pytest.approx(summary[1])
+    assert collected == [len(game.liveData.plays.allPlays)]
+
+    # files from another schema version are ignored
+    monkeypatch.setattr(umpire_module, 'SCHEMA_VERSION', -1)
+    assert not umpire_module._load_disk_cache(748534)
+
+@pytest.mark.parametrize('setting', ['BUFFER_FEET',
+                                     'HAWKEYE_MARGIN_OF_ERROR_FEET',
+                                     'MONTE_CARLO_SIMULATIONS'])
+def test_disk_cache_ignored_when_settings_change(setting, monkeypatch):
+    get_umpire_summary(open_748534(), method='zone')
+    assert umpire_module._load_disk_cache(748534)
+
+    monkeypatch.setattr(umpire_module, setting,
+                        getattr(umpire_module, setting) * 2)
+    assert not umpire_module._load_disk_cache(748534)
+
+def test_get_umpire_summary_disk_cache_ahead_of_game(disk_cache_dir):
+    get_umpire_summary(open_748534(), method='zone')
+    assert (disk_cache_dir / '748534.json').exists()
+
+    # same game 20 at bats in, like a delayed view of a cached game
+    truncated = open_748534()
+    del truncated.liveData.plays.allPlays[20:]
+
+    umpire = Umpire(game=truncated, method='zone')
+    umpire.calculate_game()
+
+    _UMPIRE_CACHE.clear()
+    summary = get_umpire_summary(truncated, method='zone')
+
+    assert summary[0] == umpire.num_missed_calls
+    assert summary[1] == pytest.approx(umpire.home_favor)
+    assert summary[2] == pytest.approx(umpire.home_wpa)
+
+def test_get_umpire_summary_disk_cache_ahead_of_at_bat():
+    get_umpire_summary(open_748534(), method='zone')
+
+    # at bat 52 cut one pitch before its missed call and still going
+    game = open_748534()
+    del game.liveData.plays.allPlays[53:]
+    at_bat = game.liveData.plays.allPlays[52]
+    del at_bat.playEvents[1:]
+    at_bat.about.isComplete = False
+
+    umpire = Umpire(game=game, method='zone')
+    umpire.calculate_game()
+
+    _UMPIRE_CACHE.clear()
+    summary = get_umpire_summary(game, method='zone')
+
+    assert summary[0] == umpire.num_missed_calls == 2
+    assert summary[1] == pytest.approx(umpire.home_favor)
+    assert summary[2] == pytest.approx(umpire.home_wpa)